@@ -4,6 +4,7 @@ from manim.mobject.geometry import Elbow, Polygon, RoundedRectangle
 from manim.mobject.svg.tex_mobject import MathTex
 from manim.mobject.types.vectorized_mobject import VGroup
 from manim.utils.space_ops import angle_of_vector, rotate_vector
+from utils import project_onto_lines
 
 
 def get_right_angle_to_edge(perp_line, width, **kwargs):
@@ -47,6 +48,56 @@ def length_indicators_updater(rects, perp_lines):
     return rects.arrange(DOWN, 0).next_to(rects.dl_corner, buff=0, aligned_edge=DOWN)
 
 
+def get_distances_to_edges_updater(
+    eq_triangle, dot, perp_lines, right_angles, length_indicators
+):
+    """
+    Updater that does what perp_line_updater, right_angle_updater and
+    length_indicators_updater do together, from one batched projection of the
+    dot onto the edges, writing the points of the lines, right angles and
+    length indicators directly. The mobject it's called on is ignored, so it
+    can be run on any group of these, like
+    UpdateFromFunc(Group(*perp_lines, *right_angles, length_indicators), updater).
+    """
+    edge_indices = np.array([line.edge_index for line in perp_lines])
+    alphas = np.linspace(0, 1, perp_lines[0].n_points_per_cubic_curve)[:, np.newaxis]
+
+    def update(mob):
+        point = dot.get_center()
+        feet, lengths = project_onto_lines(
+            point, eq_triangle.get_edge_lines(edge_indices)
+        )
+
+        for line, right_angle, foot in zip(perp_lines, right_angles, feet):
+            if line.points.shape == (len(alphas), 3):
+                line.points[:] = point + alphas * (foot - point)
+            else:
+                line.put_start_and_end_on(point, foot)
+            # corner of the elbow is its end plus the vector from its corner
+            # anchor to its start.
+            elbow_points = right_angle.points
+            elbow_points += foot - (
+                elbow_points[-1] + elbow_points[0] - elbow_points[3]
+            )
+
+        # bars stacked top to bottom, resting on dl_corner, never flattened
+        # completely so that they can be stretched back.
+        heights = np.maximum(lengths, 1e-4)
+        x_min, y_min = length_indicators.dl_corner[:2]
+        bottoms = y_min + np.cumsum(heights[::-1])[::-1] - heights
+        for rect, height, bottom in zip(length_indicators, heights, bottoms):
+            members = rect.family_members_with_points()
+            all_points = np.concatenate([m.points for m in members])
+            (left, low, _), (_, high, _) = all_points.min(0), all_points.max(0)
+            scale = height / (high - low) if high > low else 1
+            for m in members:
+                m.points[:, 0] += x_min - left
+                m.points[:, 1] = bottom + (m.points[:, 1] - low) * scale
+        return mob
+
+    return update
+
+
 def get_triangle_to_edge(edge_index, eq_triangle, point, **kwargs):
     vertices = eq_triangle.get_vertices()
     vertices = np.append(vertices, [vertices[0]], 0)
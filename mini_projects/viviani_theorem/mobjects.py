@@ -1,24 +1,49 @@
+from functools import lru_cache
+
 import numpy as np
-from manim.constants import TAU
+from manim.constants import OUT, TAU
 from manim.mobject.geometry import Line, Triangle
 from manim.mobject.mobject import Mobject
 from manim.mobject.types.vectorized_mobject import VMobject
-from utils import project_along_line
+from utils import project_onto_lines
+
+
+@lru_cache(maxsize=32)
+def get_blob_points(radius, min_scale, max_scale, n_samples, seed):
+    rng = np.random.default_rng(seed)
+    thetas = np.linspace(0, TAU, n_samples, False)
+    radii = radius * rng.uniform(min_scale, max_scale, n_samples)
+    points = np.column_stack(
+        [radii * np.cos(thetas), radii * np.sin(thetas), np.zeros(n_samples)]
+    )
+    return VMobject().set_points_smoothly([*points, points[0]]).points
 
 
 class Blob(VMobject):
+    """
+    Closed smooth curve through n_samples points around the origin, at
+    radius times random scales between min_scale and max_scale. Blobs with the
+    same seed are identical, and the points of the most recently used seeds
+    are cached so that they are only computed once. With seed=None, every
+    blob is different.
+    """
+
     def __init__(
-        self, radius=1, min_scale=0.75, max_scale=1.25, n_samples=10, **kwargs
+        self,
+        radius=1,
+        min_scale=0.75,
+        max_scale=1.25,
+        n_samples=10,
+        seed=None,
+        **kwargs
     ):
         super().__init__(**kwargs)
-        np.random.seed()
-        points = [
-            np.array([np.cos(theta), np.sin(theta), 0])
-            * radius
-            * np.random.uniform(min_scale, max_scale)
-            for theta in np.linspace(0, TAU, n_samples, False)
-        ]
-        self.set_points_smoothly([*points, points[0]])
+        args = (radius, min_scale, max_scale, n_samples, seed)
+        if seed is None:
+            points = get_blob_points.__wrapped__(*args)
+        else:
+            points = get_blob_points(*args).copy()
+        self.points = points
 
 
 class EquilateralTriangle(Triangle):
@@ -34,13 +59,34 @@ class EquilateralTriangle(Triangle):
     def side_length(self, side_length):
         self.scale(side_length / (np.sqrt(3) * self.circumradius))
 
+    def get_edge_table(self):
+        """
+        (vertices, unit_edges, inward_normals), each a (3, 3) array with row i
+        for the edge from vertex i to vertex i + 1. The table is cached and
+        only recomputed when the points of the triangle change.
+        """
+        cache = getattr(self, "_edge_table_cache", None)
+        if cache is None or not np.array_equal(cache[0], self.points):
+            vertices = self.get_vertices()
+            edges = np.roll(vertices, -1, axis=0) - vertices
+            unit_edges = edges / np.linalg.norm(edges, axis=1, keepdims=True)
+            normals = np.cross(OUT, unit_edges)
+            centroid = vertices.mean(0)
+            signs = np.sign(np.einsum("ij,ij->i", centroid - vertices, normals))
+            normals *= signs[:, np.newaxis]
+            cache = (self.points.copy(), (vertices, unit_edges, normals, centroid))
+            self._edge_table_cache = cache
+        return cache[1][:3]
+
     @property
     def circumcenter(self):
-        return self.get_center_of_mass()
+        self.get_edge_table()
+        return self._edge_table_cache[1][3].copy()
 
     @property
     def circumradius(self):
-        return np.linalg.norm(self.get_vertices()[0] - self.circumcenter)
+        vertices = self.get_edge_table()[0]
+        return np.linalg.norm(vertices[0] - self.circumcenter)
 
     @property
     def inradius(self):
@@ -53,12 +99,24 @@ class EquilateralTriangle(Triangle):
         self._side_length = self.circumradius * np.sqrt(3)
         return self
 
+    def get_edge_lines(self, edge_index):
+        """
+        Endpoints of edge edge_index, the edge from vertex edge_index to the
+        next one, as a (2, 3) array, or an (M, 2, 3) array for M edge indices.
+        """
+        vertices = self.get_edge_table()[0]
+        edge_index = np.asarray(edge_index) % len(vertices)
+        next_index = (edge_index + 1) % len(vertices)
+        return np.stack([vertices[edge_index], vertices[next_index]], axis=-2)
+
     def get_projection_onto_edge(self, edge_index, point):
-        # There is a formula to get fop, but hey I love vectors, so why not!
-        vertices = self.get_vertices()
-        vertices = np.append(vertices, [vertices[0]], 0)
-        vertex1, vertex2 = vertices[edge_index : edge_index + 2]
-        return project_along_line(vertex1, vertex2, point)
+        """
+        Foot of the perpendicular from point onto edge edge_index. point can be
+        an (N, 3) array and edge_index a list of M edges, like one point onto
+        all the edges with get_projection_onto_edge([0, 1, 2], point), with the
+        shapes of :func:`project_onto_lines`.
+        """
+        return project_onto_lines(point, self.get_edge_lines(edge_index))[0]
 
     def get_perpendicular_line_to_edge(
         self, edge_index, point, line_class=Line, **kwargs
@@ -15,6 +15,11 @@ config.background_color = "#111111"
 
 
 class VivianiTheorem(Scene):
+    def __init__(self, blob_seeds=(0, 1), **kwargs):
+        # one random path of the dot per seed, a new one every render for None
+        self.blob_seeds = blob_seeds
+        super().__init__(**kwargs)
+
     def construct(self):
         with RegisterFont("Merienda") as fonts:
             title = Text("Viviani Theorem", font=fonts[0], color=GOLD_E).scale(2)
@@ -98,32 +103,19 @@ class VivianiTheorem(Scene):
         self.wait()
 
         updater_anims = [
-            *map(
-                lambda l: UpdateFromFunc(
-                    l, lambda l: perp_line_updater(l, triangle, dot)
-                ),
-                perp_lines,
-            ),
-            UpdateFromFunc(
-                length_indicators, lambda li: length_indicators_updater(li, perp_lines)
-            ),
-            UpdateFromFunc(
-                right_angles[0],
-                lambda r: right_angle_updater(right_angles[0], perp_lines[0]),
-            ),
             UpdateFromFunc(
-                right_angles[1],
-                lambda r: right_angle_updater(right_angles[1], perp_lines[1]),
-            ),
-            UpdateFromFunc(
-                right_angles[2],
-                lambda r: right_angle_updater(right_angles[2], perp_lines[2]),
-            ),
+                Group(*perp_lines, *right_angles, length_indicators),
+                get_distances_to_edges_updater(
+                    triangle, dot, perp_lines, right_angles, length_indicators
+                ),
+            )
         ]
 
         def move_dot_along_random_path(blob_center):
-            for _ in range(2):
-                blob = Blob(triangle.inradius - 0.125, max_scale=0.95, n_samples=15)
+            for seed in self.blob_seeds:
+                blob = Blob(
+                    triangle.inradius - 0.125, max_scale=0.95, n_samples=15, seed=seed
+                )
                 blob.shift(blob_center)
                 self.play(
                     dot.animate.move_to(blob.points[0]),
@@ -1,6 +1,166 @@
+from functools import lru_cache
+from typing import Callable, Sequence, Tuple
+
+import numpy as np
+
+
+def sample_t_func(t_func: Callable, t_values: Sequence[float]):
+    """
+    Evaluates t_func at every value of t_values and returns the points
+    as rows of an (N, dim) array. t_func is called once with the whole
+    array when it supports it (like cycloid), else once per value. Like
+    with a single t, a vectorized t_func returns the coordinates along
+    its first axis, so the result has one more dimension than t_values.
+    """
+    t_values = np.asarray(t_values, dtype=float)
+    try:
+        points = np.asarray(t_func(t_values), dtype=float)
+        if np.ndim(points) == np.ndim(t_values) + 1:
+            points = np.moveaxis(points, 0, -1)
+            if points.shape[:-1] == t_values.shape:
+                return points
+    except (TypeError, ValueError):
+        pass
+    return np.array([t_func(t) for t in t_values], dtype=float)
+
+
+def get_speed(t_func: Callable, t: Sequence[float], h: float = 1e-6):
+    """
+    Instantaneous speed |r'(t)| using a central difference of width 2h.
+    """
+    t = np.asarray(t, dtype=float)
+    ends = sample_t_func(t_func, np.concatenate([t.ravel() - h, t.ravel() + h]))
+    start, end = np.split(ends, 2)
+    return np.linalg.norm(end - start, axis=1).reshape(t.shape) / (2 * h)
+
+
 def get_velocity(t_func, t, dt=0.01):
-    pass
+    """
+    Average speed over [t, t + dt], i.e. the length of the secant line
+    from t_func(t) to t_func(t + dt) divided by dt.
+    """
+    t = np.asarray(t, dtype=float)
+    ends = sample_t_func(t_func, np.concatenate([t.ravel(), t.ravel() + dt]))
+    start, end = np.split(ends, 2)
+    velocity = np.linalg.norm(end - start, axis=1).reshape(t.shape) / dt
+    return velocity if velocity.ndim else float(velocity)
+
+
+@lru_cache(maxsize=32)
+def get_fine_samples(
+    t_func: Callable, t_min: float, t_max: float, step: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns (t_values, points) of t_func on a fixed grid of the given step over
+    [t_min, t_max], cached on (t_func, t_min, t_max, step). The returned arrays
+    are read-only.
+    """
+    t_values = np.append(np.arange(t_min, t_max, step), t_max)
+    points = sample_t_func(t_func, t_values)
+    for array in (t_values, points):
+        array.flags.writeable = False
+    return t_values, points
+
+
+def get_secant_velocities(
+    t_func: Callable, t_min: float, t_max: float, dt: float, fine_step: float = 1e-3
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns (t_values, velocities) for t_values = arange(t_min, t_max, dt).
+    The ends of the secants are interpolated in the samples of t_func on a
+    fixed grid of fine_step (see get_fine_samples), so they are shared by all
+    values of dt, like those of a dt tracker changing on every frame. Ends
+    past t_max are evaluated directly. dt should be well above fine_step.
+    """
+    t_values = np.arange(t_min, t_max, dt)
+    ends = np.append(t_values, t_values[-1:] + dt)
+    grid_t, grid_points = get_fine_samples(t_func, t_min, t_max, fine_step)
+    points = np.column_stack(
+        [np.interp(ends, grid_t, coords) for coords in grid_points.T]
+    )
+    is_outside = ends > t_max
+    if is_outside.any():
+        points[is_outside] = sample_t_func(t_func, ends[is_outside])
+    velocities = np.linalg.norm(np.diff(points, axis=0), axis=1) / dt
+    return t_values, velocities
+
+
+def integrate_speed(
+    t_func: Callable,
+    a: np.ndarray,
+    b: np.ndarray,
+    tol: float = 1e-6,
+    max_depth: int = 30,
+):
+    """
+    Arc length of t_func over each of the intervals [a[i], b[i]], found with
+    adaptive Simpson quadrature on the speed. All intervals that still need
+    refining are evaluated together, so t_func is called once per level of
+    refinement rather than once per sample.
+
+    Parameters
+    ----------
+    a, b: Arrays of interval start and end values.
+    tol: Absolute error tolerance, split between the intervals in
+        proportion to their widths.
+    max_depth: Maximum number of times an interval is halved.
+    """
+    a, b = np.atleast_1d(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    lengths = np.zeros(len(a))
+    owners = np.arange(len(a))
+    total_width = np.sum(np.abs(b - a)) or 1
+    tols = tol * np.abs(b - a) / total_width
+
+    m = (a + b) / 2
+    fa, fm, fb = np.split(get_speed(t_func, np.concatenate([a, m, b])), 3)
+    whole = (b - a) / 6 * (fa + 4 * fm + fb)
+
+    for depth in range(max_depth + 1):
+        if not len(a):
+            break
+        m = (a + b) / 2
+        f_left, f_right = np.split(
+            get_speed(t_func, np.concatenate([(a + m) / 2, (m + b) / 2])), 2
+        )
+        left = (m - a) / 6 * (fa + 4 * f_left + fm)
+        right = (b - m) / 6 * (fm + 4 * f_right + fb)
+        error = left + right - whole
+
+        done = np.abs(error) <= 15 * tols
+        if depth == max_depth:
+            done[:] = True
+        np.add.at(lengths, owners[done], (left + right + error / 15)[done])
+
+        todo = ~done
+        a, m, b = a[todo], m[todo], b[todo]
+        fa, fm, fb = fa[todo], fm[todo], fb[todo]
+        f_left, f_right = f_left[todo], f_right[todo]
+        a, b = np.concatenate([a, m]), np.concatenate([m, b])
+        fa, fb = np.concatenate([fa, fm]), np.concatenate([fm, fb])
+        fm = np.concatenate([f_left, f_right])
+        whole = np.concatenate([left[todo], right[todo]])
+        owners = np.tile(owners[todo], 2)
+        tols = np.tile(tols[todo], 2) / 2
+
+    return lengths
+
+
+def get_arc_length_table(
+    t_func: Callable, t_min: float, t_max: float, dt: float = 0.01, tol: float = 1e-6
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the arrays (t_values, arc_lengths) where arc_lengths[i] is the
+    length of the curve from t_min to t_values[i], with t_values spaced
+    (at most) dt apart. Use np.interp on the table to look up the arc length
+    at any t in between instead of integrating again.
+    """
+    n_steps = max(int(np.ceil(abs(t_max - t_min) / dt - 1e-9)), 1)
+    t_values = np.linspace(t_min, t_max, n_steps + 1)
+    if t_min == t_max:
+        return t_values, np.zeros_like(t_values)
+    lengths = integrate_speed(t_func, t_values[:-1], t_values[1:], tol)
+    return t_values, np.concatenate([[0], np.cumsum(lengths)])
 
 
-def get_arc_length(t_func, t_min, t_max, dt=0.01):
-    pass
+def get_arc_length(t_func, t_min, t_max, dt=0.01, tol=1e-6):
+    return get_arc_length_table(t_func, t_min, t_max, dt, tol)[1][-1]
@@ -161,8 +161,7 @@ class ArcLengthScene(Scene):
         gradient = gradient or self.secant_gradient
         lines = VGroup()
 
-        for t in arange(t_min, t_max, dt):
-            height = get_velocity(t_func, t, dt)
+        for t, height in zip(*get_secant_velocities(t_func, t_min, t_max, dt)):
             lines.add(Line(*[axes.c2p(x, height) for x in [t, t + dt]]))
         lines.set_style(**style).set_color_by_gradient(*gradient)
         return lines
@@ -179,8 +178,8 @@ class ArcLengthScene(Scene):
         )
         rects = VGroup()
 
-        for t in arange(t_min, t_max, dt):
-            height = get_velocity(t_func, t, dt) * axes.y_axis.unit_size
+        for t, velocity in zip(*get_secant_velocities(t_func, t_min, t_max, dt)):
+            height = velocity * axes.y_axis.unit_size
             rect = Rectangle(width=width, height=height)
             rect.next_to(axes.c2p(t, 0), UP, aligned_edge=LEFT, buff=0)
             rects.add(rect)
@@ -627,9 +626,10 @@ class LoyalParticleAndTheInstruction(ArcLengthScene):
         b_dist_line = Line(start, b.get_center(), color=self.curve_color)
 
         t = self.t_tracker
+        arc_length_table = get_arc_length_table(self.t_func, 0, self.t_max, 0.01)
 
         def update_line(line):
-            dist = get_arc_length(self.t_func, 0, t.get_value(), 0.01)
+            dist = np.interp(t.get_value(), *arc_length_table)
             line.set_length((dist + 0.001) * self.plane.x_axis.unit_size)
             line.next_to(start, buff=0)
 
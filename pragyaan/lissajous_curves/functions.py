@@ -1,20 +1,69 @@
+from fractions import Fraction
+from functools import lru_cache, reduce
+from math import comb
+
 import numpy as np
-from manim.constants import RIGHT, UP
+from manim.constants import RIGHT, TAU, UP
 from manim.mobject.types.vectorized_mobject import VGroup
-from manim.utils.bezier import bezier
 from manim.utils.color import color_to_rgba, rgba_to_color
 from mobjects import LissajousCircle
 
 
+def get_max_circles(length, buff, radius):
+    # circles of the radius that fit in length, buff apart
+    return int((length + buff) / (2 * radius + buff))
+
+
+class ColorRamp:
+    """
+    Bezier blend of colors over [min_value, max_value], tabulated at n_entries
+    evenly spaced values, so that mapping a whole array of values to colors is
+    a single indexing operation. Values outside the range are clipped to it.
+    """
+
+    def __init__(self, min_value, max_value, *colors, n_entries=256):
+        if len(colors) == 0:
+            raise ValueError("Atleast 1 color needed, passed 0")
+        if len(colors) == 1:
+            colors = list(colors) * 2
+        rgba_s = np.array(list(map(color_to_rgba, colors)))
+        degree = len(rgba_s) - 1
+        alphas = np.linspace(0, 1, n_entries)[:, np.newaxis]
+        self.rgbas = sum(
+            comb(degree, k) * (1 - alphas) ** (degree - k) * alphas**k * rgba
+            for k, rgba in enumerate(rgba_s)
+        )
+        self.min_value = min_value
+        self.max_value = max_value
+
+    def get_rgbas(self, values):
+        """(*values.shape, 4) array of the colors of values."""
+        alphas = (np.asarray(values, dtype=float) - self.min_value) / (
+            self.max_value - self.min_value
+        )
+        indices = np.rint(np.clip(alphas, 0, 1) * (len(self.rgbas) - 1))
+        return self.rgbas[indices.astype(int)]
+
+    def __call__(self, values):
+        rgbas = self.get_rgbas(values)
+        if rgbas.ndim == 1:
+            return rgba_to_color(rgbas)
+        return [rgba_to_color(rgba) for rgba in rgbas.reshape(-1, 4)]
+
+
+@lru_cache(maxsize=32)
+def get_color_ramp(min_value, max_value, *color_names, n_entries=256):
+    return ColorRamp(min_value, max_value, *color_names, n_entries=n_entries)
+
+
 def color_map(speed, min_value, max_value, *colors):
-    alpha = (speed - min_value) / (max_value - min_value)
-    if len(colors) == 0:
-        raise ValueError("Atleast 1 color needed, passed 0")
-    if len(colors) == 1:
-        colors = list(colors) * 2
-    rgba_s = np.array(list(map(color_to_rgba, colors)))
-    interpolated_color = rgba_to_color(bezier(rgba_s)(alpha))
-    return interpolated_color
+    """
+    Color(s) of speed, a value or an array of values, on the bezier blend of
+    colors over [min_value, max_value]. The lookup table is built once for
+    every combination of range and colors.
+    """
+    ramp = get_color_ramp(min_value, max_value, *map(str, colors))
+    return ramp(speed)
 
 
 def get_circles(
@@ -29,3 +78,43 @@ def get_circles(
 
 def get_intersection_point(row_circ, column_circ):
     return row_circ.dot.get_x() * RIGHT + column_circ.dot.get_y() * UP
+
+
+def get_common_period(*periods, max_denominator=1000):
+    """
+    Least common multiple of the periods, approximating their ratios
+    by fractions with denominators upto max_denominator.
+    """
+
+    def lcm(period_1, period_2):
+        ratio = Fraction(period_1 / period_2).limit_denominator(max_denominator)
+        return period_1 * ratio.denominator
+
+    return reduce(lcm, periods)
+
+
+def get_lissajous_period(row_speed, column_speed, **kwargs):
+    """
+    Time after which both circles are back where they started, i.e. the time
+    it takes to trace their lissajous figure exactly once.
+    """
+    return get_common_period(TAU / row_speed, TAU / column_speed, **kwargs)
+
+
+def get_circle_radius(circle):
+    return np.linalg.norm(circle.points[0] - circle.get_arc_center())
+
+
+def get_lissajous_points(row_circ, column_circ, t_values):
+    """
+    (len(t_values), 3) array of the intersection points, t_values from now,
+    of the circles moving at their speeds.
+    """
+    t_values = np.asarray(t_values)
+    x = row_circ.get_arc_center()[0] + get_circle_radius(row_circ) * np.cos(
+        row_circ.theta + row_circ.speed * t_values
+    )
+    y = column_circ.get_arc_center()[1] + get_circle_radius(column_circ) * np.sin(
+        column_circ.theta + column_circ.speed * t_values
+    )
+    return np.column_stack([x, y, np.zeros_like(x)])
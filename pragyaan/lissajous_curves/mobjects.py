@@ -1,5 +1,7 @@
+import numpy as np
 from manim.constants import TAU
 from manim.mobject.geometry import Circle, Dot, Line
+from manim.mobject.types.vectorized_mobject import VMobject
 
 
 class LissajousCircle(Circle):
@@ -41,3 +43,151 @@ class LissajousCircle(Circle):
         self.dot.move_to(self.point_from_proportion(self.theta / TAU))
         if self.include_radius_line:
             self.radius_line.set_angle(self.theta)
+
+
+class PhaseClock:
+    """
+    Advances a set of LissajousCircles together. Their angles live in one array
+    that moves by speeds * dt per frame. The points of all the dots, and of all
+    the radius lines, are views into one array each, so that every frame they
+    are moved with a single write, instead of a point_from_proportion and a
+    set_angle per circle. Circles are assumed not to move or scale while the
+    clock runs, and their dots and radius lines to keep the points it gave them.
+    """
+
+    def __init__(self, circles):
+        self.circles = list(circles)
+        self.speeds = np.array([c.speed for c in self.circles], dtype=float)
+        self.thetas = np.array([c.theta for c in self.circles], dtype=float)
+        self.centers = np.array([c.get_arc_center() for c in self.circles])
+        self.radii = np.linalg.norm(
+            [c.points[0] - center for c, center in zip(self.circles, self.centers)],
+            axis=1,
+        )
+        self.dot_positions = np.array([c.dot.get_center() for c in self.circles])
+        self.line_alphas = np.linspace(0, 1, self.circles[0].n_points_per_cubic_curve)
+        self.has_radius_line = np.array([c.include_radius_line for c in self.circles])
+
+        # (n_circles, n_dot_points, 3) and (n_lines, n_points_per_cubic_curve, 3)
+        self.dot_points = np.array([c.dot.points for c in self.circles], dtype=float)
+        self.line_points = self.get_radius_line_points(self.dot_positions)
+        for circle, points in zip(self.circles, self.dot_points):
+            circle.dot.points = points
+        line_circles = [c for c in self.circles if c.include_radius_line]
+        for circle, points in zip(line_circles, self.line_points):
+            circle.radius_line.points = points
+
+    def get_dot_positions(self, thetas=None):
+        thetas = self.thetas if thetas is None else thetas
+        directions = np.column_stack(
+            [np.cos(thetas), np.sin(thetas), np.zeros_like(thetas)]
+        )
+        return self.centers + self.radii[:, np.newaxis] * directions
+
+    def get_radius_line_points(self, dot_positions):
+        centers = self.centers[self.has_radius_line]
+        ends = dot_positions[self.has_radius_line]
+        return (
+            centers[:, np.newaxis]
+            + self.line_alphas[:, np.newaxis] * (ends - centers)[:, np.newaxis]
+        )
+
+    def update(self, dt):
+        self.thetas += self.speeds * dt
+        wrapped = self.thetas > TAU
+        self.thetas[wrapped] -= TAU
+        positions = self.get_dot_positions()
+        self.dot_points += (positions - self.dot_positions)[:, np.newaxis]
+        self.line_points[:] = self.get_radius_line_points(positions)
+        self.dot_positions = positions
+
+        for circle, theta, is_wrapped in zip(self.circles, self.thetas, wrapped):
+            circle.theta = theta
+            circle.cycle_incremented = is_wrapped
+
+
+class LineSet(VMobject):
+    """
+    Straight lines from starts[i] to ends[i], held as the subpaths of a single
+    VMobject, so that moving them rewrites its points in place instead of
+    creating new Line objects.
+    """
+
+    def __init__(self, starts, ends, **kwargs):
+        super().__init__(**kwargs)
+        self.put_starts_and_ends_on(starts, ends)
+
+    def put_starts_and_ends_on(self, starts, ends):
+        starts = np.asarray(starts, dtype=float)
+        ends = np.asarray(ends, dtype=float)
+        n_points = self.n_points_per_cubic_curve
+        if self.points.shape != (len(starts) * n_points, 3):
+            self.points = np.zeros((len(starts) * n_points, 3))
+        alphas = np.linspace(0, 1, n_points)[:, np.newaxis]
+        curves = self.points.reshape(len(starts), n_points, 3)
+        np.multiply(alphas, (ends - starts)[:, np.newaxis], out=curves)
+        curves += starts[:, np.newaxis]
+        return self
+
+
+class LissajousPath(VMobject):
+    """
+    A path of line segments that gets traced a point at a time. The curves live
+    in a preallocated buffer that grows geometrically and self.points is a view
+    into it, so adding a point doesn't copy the path. If max_curves is given,
+    only the latest max_curves segments are kept, in a fixed size ring buffer
+    with every curve written twice so that the live curves stay contiguous.
+    """
+
+    def __init__(self, start_point, max_curves=None, initial_capacity=256, **kwargs):
+        super().__init__(**kwargs)
+        self.max_curves = max_curves
+        capacity = max_curves or initial_capacity
+        self.buffer = np.zeros((2 * capacity, self.n_points_per_cubic_curve, 3))
+        self.start_index = 0
+        self.n_curves = 0
+        self.last_point = np.array(start_point, dtype=float)
+        self.points = self.buffer[:0].reshape(-1, 3)
+
+    def sync_buffer(self):
+        # self.points was replaced (e.g. by an animation), so take it as the path
+        curves = self.points.reshape(-1, self.n_points_per_cubic_curve, 3)
+        if self.max_curves is not None:
+            curves = curves[-self.max_curves :]
+        capacity = max(len(self.buffer) // 2, len(curves))
+        self.buffer = np.zeros((2 * capacity, *curves.shape[1:]))
+        self.buffer[: len(curves)] = curves
+        if self.max_curves is not None:
+            self.buffer[capacity : capacity + len(curves)] = curves
+        self.start_index = 0
+        self.n_curves = len(curves)
+        if len(curves):
+            self.last_point = curves[-1, -1].copy()
+
+    def add_curve(self, curve):
+        capacity = len(self.buffer) // 2
+        if self.max_curves is None:
+            if self.n_curves == len(self.buffer):
+                self.buffer = np.concatenate([self.buffer, np.zeros_like(self.buffer)])
+            self.buffer[self.n_curves] = curve
+            self.n_curves += 1
+        else:
+            if self.n_curves < capacity:
+                index = (self.start_index + self.n_curves) % capacity
+                self.n_curves += 1
+            else:
+                index = self.start_index
+                self.start_index = (self.start_index + 1) % capacity
+            self.buffer[index] = self.buffer[index + capacity] = curve
+
+    def add_points_as_corners(self, points):
+        if not np.may_share_memory(self.points, self.buffer):
+            self.sync_buffer()
+        alphas = np.linspace(0, 1, self.n_points_per_cubic_curve)[:, np.newaxis]
+        for point in points:
+            point = np.array(point, dtype=float)
+            self.add_curve(self.last_point + alphas * (point - self.last_point))
+            self.last_point = point
+        live_curves = self.buffer[self.start_index : self.start_index + self.n_curves]
+        self.points = live_curves.reshape(-1, 3)
+        return self
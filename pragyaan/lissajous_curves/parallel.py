@@ -0,0 +1,150 @@
+"""
+Renders a lissajous table scene as horizontal bands of figures, each on its own
+process, and overlays the bands into one movie with ffmpeg. The first band has
+the circles and guide lines and an opaque background, the rest are rendered
+transparent with only their figures. Run from this directory:
+
+    python parallel.py RadiusHalf -n 4 -q low_quality
+    python parallel.py --benchmark -n 4 -q low_quality
+"""
+
+import argparse
+import inspect
+import os
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+PRESETS = ("RadiusOne", "RadiusThreeFourths", "RadiusHalf")
+
+
+def render_tile(scene_name, tile, media_dir, quality, scene_kwargs={}):
+    """
+    Renders the scene (a band of it if tile is (tile_index, n_tiles)) into
+    media_dir and returns the path to the movie.
+    """
+    import scenes
+    from manim import tempconfig
+
+    transparent = tile is not None and tile[0] > 0
+    with tempconfig(
+        {"media_dir": str(media_dir), "quality": quality, "transparent": transparent}
+    ):
+        scene = getattr(scenes, scene_name)(tile=tile, **scene_kwargs)
+        scene.render()
+        return str(scene.renderer.file_writer.movie_file_path)
+
+
+def get_n_bands(scene_name, scene_kwargs={}):
+    """
+    Number of column circles of the scene, the most bands it can be split into,
+    found from the defaults of LissajousTableScene, the preset of the scene and
+    scene_kwargs, without building the scene.
+    """
+    import scenes
+    from functions import get_max_circles
+    from manim import config
+
+    parameters = inspect.signature(scenes.LissajousTableScene.__init__).parameters
+    scene_config = {
+        name: parameter.default
+        for name, parameter in parameters.items()
+        if parameter.default is not parameter.empty
+    }
+    scene_config.update(getattr(scenes, scene_name).preset, **scene_kwargs)
+    column_length = config["frame_height"] - 2 * scene_config["top_edge_buff"]
+    n_cols = get_max_circles(
+        column_length, scene_config["column_buff"], scene_config["radius"]
+    )
+    return n_cols - 1
+
+
+def composite_tiles(movie_paths, output_path):
+    inputs = []
+    for path in movie_paths:
+        inputs += ["-i", path]
+    filters = ";".join(
+        f"[{'0' if i == 1 else f'v{i - 1}'}][{i}]overlay[v{i}]"
+        for i in range(1, len(movie_paths))
+    )
+    command = ["ffmpeg", "-y", "-loglevel", "error", *inputs]
+    if filters:
+        command += ["-filter_complex", filters, "-map", f"[v{len(movie_paths) - 1}]"]
+    subprocess.run([*command, "-pix_fmt", "yuv420p", str(output_path)], check=True)
+    return output_path
+
+
+def render_parallel(
+    scene_name, n_tiles, quality="low_quality", media_dir="media", scene_kwargs={}
+):
+    n_tiles = min(n_tiles, get_n_bands(scene_name, scene_kwargs))
+    media_dir = Path(media_dir, "tiles", scene_name)
+    # separate media dirs, since tiles of a scene would share partial movie files
+    with ProcessPoolExecutor(n_tiles) as executor:
+        futures = [
+            executor.submit(
+                render_tile,
+                scene_name,
+                (i, n_tiles),
+                media_dir / str(i),
+                quality,
+                scene_kwargs,
+            )
+            for i in range(n_tiles)
+        ]
+        movie_paths = [future.result() for future in futures]
+    return composite_tiles(movie_paths, media_dir / f"{scene_name}.mp4")
+
+
+def render_single(
+    scene_name, quality="low_quality", media_dir="media", scene_kwargs={}
+):
+    # on a process of its own too, so both runs pay for starting python
+    with ProcessPoolExecutor(1) as executor:
+        media_dir = Path(media_dir, "single", scene_name)
+        future = executor.submit(
+            render_tile, scene_name, None, media_dir, quality, scene_kwargs
+        )
+        return future.result()
+
+
+def benchmark(n_tiles, quality="low_quality", scenes=PRESETS, scene_kwargs={}):
+    """
+    Wall clock times of rendering every scene on one process and in n_tiles
+    bands, printed as a table.
+    """
+    print(f"{'scene':<20}{'single (s)':>12}{'tiled (s)':>12}{'speedup':>10}")
+    for scene_name in scenes:
+        start = time.perf_counter()
+        render_single(scene_name, quality, scene_kwargs=scene_kwargs)
+        single_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        render_parallel(scene_name, n_tiles, quality, scene_kwargs=scene_kwargs)
+        tiled_time = time.perf_counter() - start
+
+        print(
+            f"{scene_name:<20}{single_time:>12.1f}{tiled_time:>12.1f}"
+            f"{single_time / tiled_time:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("scene", nargs="?", default="RadiusThreeFourths")
+    parser.add_argument("-n", "--tiles", type=int, default=os.cpu_count())
+    parser.add_argument("-q", "--quality", default="low_quality")
+    parser.add_argument("--analytic", action="store_true", help="analytic_paths")
+    parser.add_argument("--benchmark", action="store_true")
+    args = parser.parse_args()
+
+    scene_kwargs = {"analytic_paths": True} if args.analytic else {}
+    if args.benchmark:
+        benchmark(args.tiles, args.quality, scene_kwargs=scene_kwargs)
+    else:
+        print(
+            render_parallel(
+                args.scene, args.tiles, args.quality, scene_kwargs=scene_kwargs
+            )
+        )
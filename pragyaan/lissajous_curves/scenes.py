@@ -13,6 +13,9 @@ def speed_to_color_map(speed):
 
 
 class LissajousTableScene(Scene):
+    # keyword arguments the scenes of a set size are made with
+    preset = {}
+
     def __init__(
         self,
         radius=0.75,
@@ -24,6 +27,10 @@ class LissajousTableScene(Scene):
         include_radius_line=True,
         row_circle_speeds_range=(1, 3),
         column_circle_speeds_range=(1, 3),
+        path_max_curves=None,
+        analytic_paths=False,
+        samples_per_cycle=100,
+        tile=None,
         **kwargs
     ):
         self.radius = radius
@@ -40,6 +47,11 @@ class LissajousTableScene(Scene):
         )
         self.row_speed_range = row_circle_speeds_range
         self.column_speed_range = column_circle_speeds_range
+        self.path_max_curves = path_max_curves
+        self.analytic_paths = analytic_paths
+        self.samples_per_cycle = samples_per_cycle
+        # (tile_index, n_tiles) to render only a band of the table, see parallel.py
+        self.tile = tile
         super().__init__(**kwargs)
 
     def setup(self):
@@ -64,14 +76,15 @@ class LissajousTableScene(Scene):
         return (n_rows, n_cols)
 
     def get_max_circles(self, length, buff, radius=None):
-        radius = radius or self.radius
-        return int((length + buff) / (2 * radius + buff))
+        return get_max_circles(length, buff, radius or self.radius)
 
     def add_circle_updaters(self, circles=None):
         if circles is None:
             circles = [*self.row_circles, *self.column_circles]
-        for c in circles:
-            c.add_updater(lambda c, dt: c.update_point(dt))
+        # one updater moves every circle, attached to the first of them so that
+        # it runs before the lines and paths, and suspending the circles stops it.
+        self.phase_clock = PhaseClock(circles)
+        circles[0].add_updater(lambda c, dt: self.phase_clock.update(dt))
 
     def arrange_row_circles_to_match_buff(self, row_circles=None):
         circles = row_circles or self.row_circles
@@ -93,44 +106,76 @@ class LissajousTableScene(Scene):
         aligned_edge = self.column_circles.get_critical_point(UP)
         return circles.next_to(x * RIGHT + y * UP, DOWN, 0, aligned_edge)
 
-    def get_horizontal_lines(self, column_circles=None, line_style=Line, **style):
+    def get_horizontal_line_ends(self, column_circles=None):
         circles = column_circles or self.column_circles
+        starts = np.array([circ.dot.get_center() for circ in circles])
+        ends = starts.copy()
+        ends[:, 0] = config["frame_width"] / 2 - self.left_edge_buff
+        return starts, ends
+
+    def get_vertical_line_ends(self, row_circles=None):
+        circles = row_circles or self.row_circles
+        starts = np.array([circ.dot.get_center() for circ in circles])
+        ends = starts.copy()
+        ends[:, 1] = self.top_edge_buff - config["frame_height"] / 2
+        return starts, ends
+
+    def get_horizontal_lines(self, column_circles=None, line_style=Line, **style):
         lines = VGroup()
-        for circ in circles:
-            start = circ.dot.get_center()
-            end = np.array(
-                [config["frame_width"] / 2 - self.left_edge_buff, circ.dot.get_y(), 0]
-            )
+        for start, end in zip(*self.get_horizontal_line_ends(column_circles)):
             lines.add(line_style(start, end))
         return lines.set_style(**style)
 
     def get_vertical_lines(self, row_circles=None, line_style=Line, **style):
-        circles = row_circles or self.row_circles
         lines = VGroup()
-        for circ in circles:
-            start = circ.dot.get_center()
-            end = np.array(
-                [circ.dot.get_x(), self.top_edge_buff - config["frame_height"] / 2, 0]
-            )
+        for start, end in zip(*self.get_vertical_line_ends(row_circles)):
             lines.add(line_style(start, end))
         return lines.set_style(**style)
 
+    def get_horizontal_line_set(self, column_circles=None, **style):
+        return LineSet(*self.get_horizontal_line_ends(column_circles), **style)
+
+    def get_vertical_line_set(self, row_circles=None, **style):
+        return LineSet(*self.get_vertical_line_ends(row_circles), **style)
+
     def add_lines_updaters(self, h_lines, v_lines):
-        h_lines.add_updater(
-            lambda h: h.become(self.get_horizontal_lines(**h_lines.get_style()))
-        )
-        v_lines.add_updater(
-            lambda v: v.become(self.get_vertical_lines(**v_lines.get_style()))
-        )
+        # lines are moved in place, be it a LineSet or a VGroup of Lines.
+        def get_updater(get_line_ends):
+            def update_lines(lines):
+                starts, ends = get_line_ends()
+                if isinstance(lines, LineSet):
+                    lines.put_starts_and_ends_on(starts, ends)
+                else:
+                    for line, start, end in zip(lines, starts, ends):
+                        line.put_start_and_end_on(start, end)
+
+            return update_lines
+
+        h_lines.add_updater(get_updater(self.get_horizontal_line_ends))
+        v_lines.add_updater(get_updater(self.get_vertical_line_ends))
+
+    def get_tile_column_circles(self):
+        """
+        Column circles whose figures are drawn, all of them unless the scene
+        renders one of n_tiles horizontal bands of the table.
+        """
+        if self.tile is None:
+            return list(self.column_circles)
+        tile_index, n_tiles = self.tile
+        band = np.array_split(np.arange(len(self.column_circles)), n_tiles)[tile_index]
+        return [self.column_circles[i] for i in band]
+
+    def is_base_tile(self):
+        # circles and guide lines are drawn only once, beneath every tile.
+        return self.tile is None or self.tile[0] == 0
 
     def initiate_paths(self, **style):
         paths = VGroup()
-        for col_circ in self.column_circles:
+        for col_circ in self.get_tile_column_circles():
             for row_circ in self.row_circles:
                 point = get_intersection_point(row_circ, col_circ)
-                path = VMobject(**style).set_points_as_corners(
-                    [point, point * 1.0000000001]
-                )
+                path = LissajousPath(point, self.path_max_curves, **style)
+                path.add_points_as_corners([point * 1.0000000001])
                 path.set_color(
                     interpolate_color(row_circ.get_color(), col_circ.get_color(), 0.5)
                 )
@@ -155,6 +200,68 @@ class LissajousTableScene(Scene):
         for path in self.paths:
             path.add_updater(path_update_func)
 
+    def initiate_analytic_paths(self, **style):
+        """
+        Full lissajous figure of every pair of circles, over its exact period
+        from where the circles are now, each found in one vectorized evaluation.
+        Meant to be revealed with add_analytic_paths_updater, with only the
+        circles updating per frame. Paths have no dots tracing them.
+        """
+        paths = VGroup()
+        for col_circ in self.get_tile_column_circles():
+            for row_circ in self.row_circles:
+                period = get_lissajous_period(row_circ.speed, col_circ.speed)
+                cycles = period * max(row_circ.speed, col_circ.speed) / TAU
+                t_values = np.linspace(
+                    0, period, int(self.samples_per_cycle * cycles) + 1
+                )
+                path = VMobject(**style)
+                path.set_points_as_corners(
+                    get_lissajous_points(row_circ, col_circ, t_values)
+                )
+                path.set_color(
+                    interpolate_color(row_circ.get_color(), col_circ.get_color(), 0.5)
+                )
+                path.full_points = path.points
+                path.period = period
+                path.row_circle = row_circ
+                path.column_circle = col_circ
+                paths.add(path)
+        self.paths = paths
+
+    def get_analytic_trace_time(self):
+        # time taken to trace the figure with the longest period
+        return max(
+            get_lissajous_period(row_speed, column_speed)
+            for row_speed in self.row_circle_speeds
+            for column_speed in self.column_circle_speeds
+        )
+
+    def add_analytic_paths_updater(self):
+        """
+        Reveals every path over its own period, in step with the circles, with
+        one updater on all the paths. Per frame, the number of curves shown of
+        every path is found in one vectorized step from the elapsed time, and
+        each path is set to that slice of its precomputed points.
+        """
+        paths = self.paths
+        periods = np.array([path.period for path in paths])
+        n_curves = np.array(
+            [len(path.full_points) // path.n_points_per_cubic_curve for path in paths]
+        )
+
+        def update_paths(paths, dt):
+            paths.elapsed_time += dt
+            proportions = np.minimum(paths.elapsed_time / periods, 1)
+            ends = np.ceil(proportions * n_curves).astype(int)
+            for path, end in zip(paths, ends):
+                path.points = path.full_points[: end * path.n_points_per_cubic_curve]
+
+        paths.elapsed_time = 0
+        update_paths(paths, 0)
+        paths.add_updater(update_paths)
+        self.add(paths)
+
     def is_path_traced_once(self):
         # for a given combination of a row circ and a column circ,
         # if both the circles enter a new cycle in the same frame,
@@ -167,8 +274,10 @@ class LissajousTableScene(Scene):
         return True
 
     def set_circle_colors_by_speed(self):
-        for c in [*self.row_circles, *self.column_circles]:
-            c.set_color(speed_to_color_map(c.speed))
+        circles = [*self.row_circles, *self.column_circles]
+        colors = speed_to_color_map(np.array([c.speed for c in circles]))
+        for c, color in zip(circles, colors):
+            c.set_color(color)
 
     def suspend_circles_updating(self):
         [c.suspend_updating() for c in [*self.row_circles, *self.column_circles]]
@@ -185,12 +294,19 @@ class DrawLissajousFigures(LissajousTableScene):
         self.camera.background_color = "#0C2D48"
 
         lines_style = {"stroke_width": 0.75}
-        vert_lines = self.get_vertical_lines(**lines_style)
-        hor_lines = self.get_horizontal_lines(**lines_style)
+        vert_lines = self.get_vertical_line_set(**lines_style)
+        hor_lines = self.get_horizontal_line_set(**lines_style)
 
         self.set_circle_colors_by_speed()
         [c.dot.set_color(WHITE) for c in [*self.row_circles, *self.column_circles]]
-        self.initiate_paths(stroke_width=2)
+        if not self.is_base_tile():
+            VGroup(
+                self.row_circles, self.column_circles, hor_lines, vert_lines
+            ).set_opacity(0)
+        if self.analytic_paths:
+            self.initiate_analytic_paths(stroke_width=2)
+        else:
+            self.initiate_paths(stroke_width=2)
 
         # self.add(self.row_circles, self.column_circles, hor_lines, vert_lines, self.paths)
         self.wait(2)
@@ -209,6 +325,19 @@ class DrawLissajousFigures(LissajousTableScene):
             )
         )
         self.wait(2)
+        if self.analytic_paths:
+            self.play(Create(VGroup(hor_lines, vert_lines), lag_ratio=1, run_time=2))
+            self.wait(2)
+            self.add_circle_updaters()
+            self.add_lines_updaters(hor_lines, vert_lines)
+            self.add_analytic_paths_updater()
+            # every band lasts until the whole table is traced, so they line up
+            self.wait(self.get_analytic_trace_time())
+            self.paths.clear_updaters()
+            self.suspend_circles_updating()
+            self.wait(2)
+            return
+
         self.play(
             AnimationGroup(
                 Create(VGroup(hor_lines, vert_lines), lag_ratio=1),
@@ -237,33 +366,39 @@ class DrawLissajousFigures(LissajousTableScene):
 
 
 class RadiusOne(DrawLissajousFigures):
-    def __init__(self):
-        super().__init__(
-            radius=1,
-            row_buff=0.5,
-            column_buff=0.4,
-            top_edge_buff=0.5,
-            left_edge_buff=0.5,
-        )
+    preset = dict(
+        radius=1,
+        row_buff=0.5,
+        column_buff=0.4,
+        top_edge_buff=0.5,
+        left_edge_buff=0.5,
+    )
+
+    def __init__(self, **kwargs):
+        super().__init__(**dict(self.preset, **kwargs))
 
 
 class RadiusHalf(DrawLissajousFigures):
-    def __init__(self):
-        super().__init__(
-            radius=0.5,
-            row_buff=0.25,
-            column_buff=0.3,
-            top_edge_buff=0.5,
-            left_edge_buff=0.5,
-        )
+    preset = dict(
+        radius=0.5,
+        row_buff=0.25,
+        column_buff=0.3,
+        top_edge_buff=0.5,
+        left_edge_buff=0.5,
+    )
+
+    def __init__(self, **kwargs):
+        super().__init__(**dict(self.preset, **kwargs))
 
 
 class RadiusThreeFourths(DrawLissajousFigures):
-    def __init__(self):
-        super().__init__(
-            radius=0.75,
-            row_buff=0.25,
-            column_buff=0.25,
-            top_edge_buff=0.5,
-            left_edge_buff=0.5,
-        )
+    preset = dict(
+        radius=0.75,
+        row_buff=0.25,
+        column_buff=0.25,
+        top_edge_buff=0.5,
+        left_edge_buff=0.5,
+    )
+
+    def __init__(self, **kwargs):
+        super().__init__(**dict(self.preset, **kwargs))
@@ -24,6 +24,146 @@ z_axis_config = dict(
 )
 
 
+def get_lagged_alphas(alpha, n_parts, lag_ratio, rate_func=None):
+    """
+    Alphas of n_parts animated one after the other, each starting lag_ratio of
+    its run time after the previous one, as in a LaggedStart at overall alpha.
+    """
+    full_length = (n_parts - 1) * lag_ratio + 1
+    alphas = np.clip(alpha * full_length - lag_ratio * np.arange(n_parts), 0, 1)
+    if rate_func is None:
+        return alphas
+    try:
+        return np.broadcast_to(np.asarray(rate_func(alphas), dtype=float), alphas.shape)
+    except (TypeError, ValueError):  # rate_func that only takes numbers
+        return np.array([rate_func(a) for a in alphas])
+
+
+class QuadMesh(VMobject):
+    """
+    A grid of quads as a single :class:`VMobject`, quad (i, j) spanning the
+    vertices (i, j) to (i + 1, j + 1) of a (n_rows + 1, n_cols + 1, 3) array.
+    Each quad has the same 12 points as a :class:`Rectangle`, 4 quadratic
+    beziers, and a color of its own.
+    """
+
+    points_per_quad = 12
+
+    def __init__(self, vertices, **kwargs):
+        self.vertices = np.asarray(vertices, dtype=float)
+        super().__init__(**kwargs)
+
+    def init_points(self):
+        self.set_vertices(self.vertices)
+
+    def set_vertices(self, vertices):
+        vertices = np.asarray(vertices, dtype=float)
+        # ur, ul, dl, dr corners of every quad, like those of a Rectangle
+        corners = np.stack(
+            [
+                vertices[1:, 1:],
+                vertices[:-1, 1:],
+                vertices[:-1, :-1],
+                vertices[1:, :-1],
+            ],
+            axis=2,
+        ).reshape(-1, 4, 3)
+        next_corners = np.roll(corners, -1, axis=1)
+        handles = (corners + next_corners) / 2
+        points = np.stack([corners, handles, next_corners], axis=2)
+        return self.set_points(points.reshape(-1, 3))
+
+    def get_num_quads(self):
+        return len(self.get_points()) // self.points_per_quad
+
+    def get_triangulation(self, normal_vector=None):
+        # Every quad is convex, so its two interior triangles can be listed
+        # directly instead of earclipping the whole mesh.
+        n_points = len(self.get_points())
+        quads = np.arange(0, n_points, self.points_per_quad)[:, np.newaxis]
+        inner_triangles = (quads + [0, 3, 6, 0, 6, 9]).ravel()
+        return np.hstack([np.arange(n_points), inner_triangles])
+
+    def get_quad_opacities(self):
+        """
+        (n,) arrays of the fill and the stroke opacity of every quad.
+        """
+        return [
+            resize_array(self.data[name], len(self.get_points()))[
+                :: self.points_per_quad, 3
+            ]
+            for name in ("fill_rgba", "stroke_rgba")
+        ]
+
+    def set_quad_opacities(self, fill_opacities, stroke_opacities):
+        for name, opacities in zip(
+            ("fill_rgba", "stroke_rgba"), (fill_opacities, stroke_opacities)
+        ):
+            rgbas = resize_array(self.data[name], len(self.get_points()))
+            rgbas[:, 3] = np.repeat(opacities, self.points_per_quad)
+            self.data[name] = rgbas
+        return self
+
+    def set_color_by_gradient(self, *colors):
+        # One color per quad, spread over its points
+        n_quads = self.get_num_quads()
+        rgbs = np.array(list(map(color_to_rgb, color_gradient(colors, n_quads))))
+        for name in ("fill_rgba", "stroke_rgba"):
+            rgbas = resize_array(self.data[name], len(self.get_points()))
+            rgbas[:, :3] = np.repeat(rgbs, self.points_per_quad, axis=0)
+            self.data[name] = rgbas
+        return self
+
+
+class FadeInQuads(Animation):
+    """
+    Fades the quads of a :class:`QuadMesh` in one after the other, staggered
+    by lag_ratio, the way a LaggedStart of FadeIns would for a VGroup.
+    """
+
+    CONFIG = {
+        "lag_ratio": 0.05,
+    }
+
+    def begin(self):
+        self.opacities = self.mobject.get_quad_opacities()
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        quad_alphas = get_lagged_alphas(
+            alpha, self.mobject.get_num_quads(), self.lag_ratio, self.rate_func
+        )
+        self.mobject.set_quad_opacities(
+            *[quad_alphas * opacities for opacities in self.opacities]
+        )
+
+
+class ApplyPointsFunction(Animation):
+    """
+    Moves the points of a :class:`QuadMesh` to function(points), quad by quad
+    staggered by lag_ratio, the way ApplyFunction would for a VGroup.
+    """
+
+    def __init__(self, function, mesh, **kwargs):
+        self.function = function
+        super().__init__(mesh, **kwargs)
+
+    def begin(self):
+        mesh = self.mobject
+        self.start_points = mesh.get_points().copy()
+        self.target_points = np.asarray(self.function(self.start_points), dtype=float)
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        quad_alphas = get_lagged_alphas(
+            alpha, self.mobject.get_num_quads(), self.lag_ratio, self.rate_func
+        )
+        alphas = np.repeat(quad_alphas, self.mobject.points_per_quad)[:, np.newaxis]
+        self.mobject.set_points(
+            interpolate(self.start_points, self.target_points, alphas)
+        )
+
+
 class DemonstrateParametricSurfaces(ThreeDScene):
     CONFIG = {
         "plane_config": plane_config,
@@ -59,21 +199,12 @@ class DemonstrateParametricSurfaces(ThreeDScene):
         self.origin_sphere = Sphere(radius=0.12).move_to(plane.c2p(0, 0))
 
     def setup_xy_space_rectangles(self):
-        surface_rects = VGroup()
-        x_vals = np.linspace(*self.x_range, self.resolution[0], endpoint=False)
-        y_vals = np.linspace(*self.y_range, self.resolution[1], endpoint=False)
-
-        dx = x_vals[1] - x_vals[0]
-        dy = y_vals[1] - y_vals[0]
-        width = dx * self.plane.x_axis.unit_size
-        height = dy * self.plane.y_axis.unit_size
-
-        for x in x_vals:
-            for y in y_vals:
-                rect = Rectangle(width, height)
-                rect.shift(self.plane.c2p(x + dx / 2, y + dy / 2))
-                surface_rects.add(rect)
+        x_vals = np.linspace(*self.x_range, self.resolution[0] + 1)
+        y_vals = np.linspace(*self.y_range, self.resolution[1] + 1)
+        x_grid, y_grid = np.meshgrid(x_vals, y_vals, indexing="ij")
+        vertices = self.c2p(x_grid, y_grid, 0)
 
+        surface_rects = QuadMesh(vertices)
         surface_rects.set_style(**self.surface_rects_style)
         surface_rects.set_color_by_gradient(*self.surface_gradient)
         surface_rects.set_gloss(self.gloss).set_shadow(self.shadow)
@@ -103,26 +234,59 @@ class DemonstrateParametricSurfaces(ThreeDScene):
         gamma.add_updater(lambda g: g.set_value(deg(frame.euler_angles[2])))
         self.add(theta, phi, gamma)
 
+    def get_axes_transform(self):
+        """
+        (offsets, scales) such that c2p(x, y, z) = offsets + (x, y, z) * scales,
+        or None if an axis doesn't map numbers linearly. Found from a few n2p
+        calls, and only again once the axes have moved.
+        """
+        axes = (*self.plane.axes, self.z_axis)
+        key = np.array([[axis.get_start(), axis.get_end()] for axis in axes])
+        cache = getattr(self, "_axes_transform_cache", None)
+        if cache is not None and np.array_equal(cache[0], key):
+            return cache[1]
+
+        probes = np.array([0, 1, -2.5, 7.25])
+        # i-th coordinate of the points of the probes on the i-th axis
+        values = np.array(
+            [[axis.n2p(num)[i] for num in probes] for i, axis in enumerate(axes)]
+        ).T
+        offsets, scales = values[0], values[1] - values[0]
+        is_linear = np.allclose(values, offsets + probes[:, np.newaxis] * scales)
+        transform = (offsets, scales) if is_linear else None
+        self._axes_transform_cache = (key, transform)
+        return transform
+
     def c2p(self, x, y, z):
-        point = np.zeros(3, dtype=float)
+        """
+        Point of the coordinates (x, y, z), or an (N, 3) array of points if the
+        coordinates are arrays.
+        """
+        coords = np.stack(np.broadcast_arrays(x, y, z), axis=-1).astype(float)
+        transform = self.get_axes_transform()
+        if transform is not None:
+            offsets, scales = transform
+            return offsets + coords * scales
+
+        points = np.zeros_like(coords)
         axes = (*self.plane.axes, self.z_axis)
-        for i, num, axis in zip((0, 1, 2), (x, y, z), axes):
-            point[i] += axis.n2p(num)[i]
-        return point
+        for i, axis in enumerate(axes):
+            values = [axis.n2p(num)[i] for num in coords[..., i].ravel()]
+            points[..., i] = np.reshape(values, coords.shape[:-1])
+        return points
 
-    def show_xy_space_rects(self, anim_style=FadeIn, **kwargs):
-        self.play(AnimationGroup(*map(anim_style, self.surface_rects), **kwargs))
+    def show_xy_space_rects(self, anim_style=FadeInQuads, **kwargs):
+        self.play(anim_style(self.surface_rects, **kwargs))
 
     def show_what_apply_function_does(self, added_anims=[], **kwargs):
         kwargs = dict(self.apply_function_kwargs, **kwargs)
-
-        def func(rects):
-            [r.apply_function(self.function) for r in rects]
-            return rects
-
         self.play(
             AnimationGroup(
-                ApplyFunction(func, self.surface_rects, lag_ratio=kwargs["lag_ratio"]),
+                ApplyPointsFunction(
+                    self.function_on_points,
+                    self.surface_rects,
+                    lag_ratio=kwargs["lag_ratio"],
+                ),
                 *added_anims,
                 run_time=kwargs["run_time"]
             )
@@ -131,6 +295,20 @@ class DemonstrateParametricSurfaces(ThreeDScene):
     def function(self, point):
         return self.c2p(*self.parametric_function(point))
 
+    def function_on_points(self, points):
+        """
+        self.function on an (N, 3) array of points, calling parametric_function
+        once on the (3, N) array of their coordinates when it supports that.
+        """
+        points = np.asarray(points, dtype=float)
+        try:
+            outputs = np.asarray(self.parametric_function(points.T), dtype=float)
+            if outputs.shape != points.T.shape:
+                raise ValueError
+        except (TypeError, ValueError):
+            outputs = np.array([self.parametric_function(p) for p in points]).T
+        return self.c2p(*outputs)
+
     def get_resolution_braces(self, brace_directions):
         return VGroup(
             *[
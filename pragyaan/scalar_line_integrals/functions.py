@@ -1,14 +1,56 @@
+from functools import lru_cache
 from typing import Callable, Iterable, Sequence
 
 import numpy as np
-from manimlib.constants import DOWN, IN, LEFT, OUT, PI, RIGHT
+from manimlib.animation.animation import Animation
+from manimlib.constants import ORIGIN, OUT, RIGHT
 from manimlib.mobject.functions import ParametricCurve
-from manimlib.mobject.geometry import Line, Polygon, Rectangle
-from manimlib.mobject.mobject import Group
+from manimlib.mobject.geometry import Line, Polygon
 from manimlib.mobject.number_line import NumberLine
 from manimlib.mobject.three_dimensions import Sphere
-from manimlib.mobject.types.surface import SGroup
-from manimlib.mobject.types.vectorized_mobject import VGroup
+from manimlib.mobject.types.surface import ParametricSurface, Surface
+from manimlib.mobject.types.vectorized_mobject import VGroup, VMobject
+from manimlib.utils.bezier import interpolate
+from manimlib.utils.color import color_to_rgb, rgb_to_color
+from manimlib.utils.iterables import resize_array
+from manimlib.utils.paths import straight_path
+
+from ..arc_length.functions import sample_t_func
+
+
+class CoordinateTransform:
+    """
+    The affine map c2p applies for a set of axes: scale by the unit sizes,
+    then shift to the origin. The matrix and origin are only recomputed when
+    the start or end of an axis has changed, i.e. the axes moved or rescaled.
+    """
+
+    def __init__(self):
+        self.axes_ends = None
+
+    def update(self, axes: Iterable[NumberLine]):
+        axes_ends = np.array([[axis.get_start(), axis.get_end()] for axis in axes.axes])
+        if self.axes_ends is not None and np.array_equal(axes_ends, self.axes_ends):
+            return self
+
+        unit_sizes = [axis.get_unit_size() for axis in axes.axes]
+        if len(unit_sizes) == 2:
+            unit_sizes.append(1)
+        self.matrix = np.diag(unit_sizes)
+        self.origin = axes.axes[0].n2p(0)
+        self.axes_ends = axes_ends
+        return self
+
+    def __call__(self, points: np.ndarray):
+        return np.matmul(points, self.matrix) + self.origin
+
+
+def get_coordinate_transform(axes: Iterable[NumberLine]):
+    # Copies of axes share the transform of the original at first, but
+    # update() compares against the axes it's given, so that's harmless
+    if not hasattr(axes, "coordinate_transform"):
+        axes.coordinate_transform = CoordinateTransform()
+    return axes.coordinate_transform.update(axes)
 
 
 def c2p(axes: Iterable[NumberLine], vector: Sequence[float]):
@@ -16,15 +58,380 @@ def c2p(axes: Iterable[NumberLine], vector: Sequence[float]):
     Parameters
     ----------
     axes: An iterable of :class:`NumberLine`s forming a coordinate system.
-    vector: A point in 3D space.
+    vector: A point in 3D space, or an (N, 3) array of points.
+    """
+    return get_coordinate_transform(axes)(vector)
+
+
+class VectorizedScalarField:
+    """
+    Wraps scalar_field(x, y) so that it can always be called with arrays of x
+    and y. Fields that work on arrays (vectorized=True, or found to on the
+    first call with arrays when vectorized is None) are called once with the
+    whole arrays, the rest through an np.frompyfunc adapter, once per pair.
+    Called with numbers, it returns a float.
+    """
+
+    def __init__(
+        self, scalar_field: Callable[[float, float], float], vectorized: bool = None
+    ):
+        self.scalar_field = scalar_field
+        self.vectorized = vectorized
+        self.pointwise_field = np.frompyfunc(scalar_field, 2, 1)
+
+    def __call__(self, x, y):
+        x, y = np.broadcast_arrays(
+            np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        )
+        if x.ndim == 0:
+            return float(self.scalar_field(float(x), float(y)))
+        if self.vectorized is not False:
+            try:
+                values = np.asarray(self.scalar_field(x, y), dtype=float)
+                values = np.broadcast_to(values, x.shape)
+                self.vectorized = True
+                return values
+            except (TypeError, ValueError):
+                if self.vectorized:
+                    raise
+                self.vectorized = False
+        return self.pointwise_field(x, y).astype(float)
+
+
+@lru_cache(maxsize=32)
+def get_vectorized_scalar_field(
+    scalar_field: Callable[[float, float], float], vectorized: bool = None
+):
+    if isinstance(scalar_field, VectorizedScalarField):
+        return scalar_field
+    return VectorizedScalarField(scalar_field, vectorized)
+
+
+def evaluate_scalar_field(
+    scalar_field: Callable[[float, float], float], x: np.ndarray, y: np.ndarray
+):
+    """
+    Evaluates scalar_field at every (x, y) pair, in a single call if the
+    field works on arrays, else once per pair.
+    """
+    return get_vectorized_scalar_field(scalar_field)(x, y)
+
+
+class NestedSampler:
+    """
+    Evaluates func on n + 1 evenly spaced values of t in [t_min, t_max] and
+    remembers the result for every n. When n is a multiple of an n sampled
+    earlier, those samples are reused and func is only evaluated at the new
+    values of t, so doubling n costs n new evaluations instead of 2n + 1.
+
+    Parameters
+    ----------
+    func: Maps an array of N values of t to an (N, ...) array of samples.
+    """
+
+    def __init__(self, func: Callable[[np.ndarray], np.ndarray], t_min, t_max):
+        self.func = func
+        self.t_min = t_min
+        self.t_max = t_max
+        self.samples = {}
+
+    def __call__(self, n: int):
+        if n in self.samples:
+            return self.samples[n]
+
+        t_values = np.linspace(self.t_min, self.t_max, n + 1)
+        divisors = [m for m in self.samples if n % m == 0]
+        if not divisors:
+            samples = np.asarray(self.func(t_values), dtype=float)
+        else:
+            m = max(divisors)
+            is_new = np.ones(n + 1, dtype=bool)
+            is_new[:: n // m] = False
+            new_samples = np.asarray(self.func(t_values[is_new]), dtype=float)
+            samples = np.empty((n + 1, *new_samples.shape[1:]))
+            samples[~is_new] = self.samples[m]
+            samples[is_new] = new_samples
+
+        self.samples[n] = samples
+        return samples
+
+
+def get_rgb_gradient(colors: Sequence, length: int):
+    """
+    Same colors as manimlib's color_gradient, as an (length, 3) array of rgbs.
+    """
+    rgbs = np.array(list(map(color_to_rgb, colors)))
+    if len(rgbs) == 1:
+        return np.repeat(rgbs, length, axis=0)
+    alphas = np.linspace(0, len(rgbs) - 1, length)
+    floors = np.minimum(alphas.astype(int), len(rgbs) - 2)
+    alphas = (alphas - floors)[:, np.newaxis]
+    return (1 - alphas) * rgbs[floors] + alphas * rgbs[floors + 1]
+
+
+class RiemannSamples:
+    """
+    The values a riemann sum of a line integral is made from: the n + 1 values
+    of t at the edges of its n rects, the points r(t) of the curve there (in
+    input coordinates) and the height of each rect, f(r(t)) for a scalar field
+    or F(r(t)).dr/|dr| for a vector field, at the start of the rect.
     """
-    unit_sizes = [axis.get_unit_size() for axis in axes.axes]
-    if len(unit_sizes) == 2:
-        unit_sizes.append(1)
 
-    transformed_vector = np.matmul(np.diag(unit_sizes), vector)
-    transformed_vector += axes.axes[0].n2p(0)
-    return transformed_vector
+    def __init__(
+        self, t_values: np.ndarray, curve_points: np.ndarray, heights: np.ndarray
+    ):
+        self.t_values = np.asarray(t_values, dtype=float)
+        self.curve_points = np.asarray(curve_points, dtype=float)
+        self.heights = np.asarray(heights, dtype=float)
+        self.dt = np.diff(self.t_values)
+        self.dr_lengths = np.linalg.norm(np.diff(self.curve_points, axis=0), axis=1)
+
+    def get_num_rects(self):
+        return len(self.heights)
+
+    def get_rescaled_heights(self):
+        """
+        Heights of the rects over the t axis with the same areas, f * |dr| / dt.
+        """
+        return self.heights * self.dr_lengths / self.dt
+
+
+class QuadSet(VMobject):
+    """
+    A set of quadrilaterals as a single :class:`VMobject`, each drawn with 4
+    straight quadratic beziers and filled with 2 triangles, one color per quad.
+    Subclasses set the corners with set_corners.
+    """
+
+    points_per_quad = 12  # 4 straight quadratic beziers
+
+    def set_corners(self, corners: np.ndarray):
+        """
+        corners: An (n, 4, 3) array with the vertices of each quad,
+            in the same order one would pass them to :class:`Polygon`.
+        """
+        vertices = np.asarray(corners, dtype=float)
+        next_vertices = np.roll(vertices, -1, axis=1)
+        handles = (vertices + next_vertices) / 2
+        points = np.stack([vertices, handles, next_vertices], axis=2)
+        self.set_points(points.reshape(-1, 3))
+        return self
+
+    def get_corners(self):
+        """
+        (n, 4, 3) array of the current vertices of every quad.
+        """
+        return self.get_points()[::3].reshape(-1, 4, 3)
+
+    def get_num_quads(self):
+        return len(self.get_points()) // self.points_per_quad
+
+    def get_triangulation(self, normal_vector=None):
+        # The quads don't lie in a common plane, but each one is convex,
+        # so the interior triangles can be listed directly instead of earclipping.
+        n_points = len(self.get_points())
+        quads = np.arange(0, n_points, self.points_per_quad)[:, np.newaxis]
+        inner_triangles = (quads + [0, 3, 6, 0, 6, 9]).ravel()
+        return np.hstack([np.arange(n_points), inner_triangles])
+
+    def get_quad_rgbas(self):
+        """
+        (n, 4) arrays of the fill and the stroke rgbas of every quad.
+        """
+        return [
+            resize_array(self.data[name], len(self.get_points()))[
+                :: self.points_per_quad
+            ]
+            for name in ("fill_rgba", "stroke_rgba")
+        ]
+
+    def set_quad_rgbas(self, fill_rgbas: np.ndarray, stroke_rgbas: np.ndarray):
+        for name, rgbas in zip(
+            ("fill_rgba", "stroke_rgba"), (fill_rgbas, stroke_rgbas)
+        ):
+            self.data[name] = np.repeat(rgbas, self.points_per_quad, axis=0)
+        return self
+
+    def set_color_by_gradient(self, *colors):
+        # One color per quad, spread over its points
+        rgbs = get_rgb_gradient(colors, self.get_num_quads())
+        fill_rgbas, stroke_rgbas = self.get_quad_rgbas()
+        return self.set_quad_rgbas(
+            np.column_stack([rgbs, fill_rgbas[:, 3]]),
+            np.column_stack([rgbs, stroke_rgbas[:, 3]]),
+        )
+
+    def get_polygons(self):
+        """
+        Returns a :class:`VGroup` of one :class:`Polygon` per quad, for
+        when the quads need to be animated individually.
+        """
+        fill_rgbas, stroke_rgbas = self.get_quad_rgbas()
+        stroke_width = self.get_stroke_width()
+        polygons = VGroup()
+        for corners, fill, stroke in zip(self.get_corners(), fill_rgbas, stroke_rgbas):
+            polygon = Polygon(*corners)
+            polygon.set_fill(rgb_to_color(fill[:3]), fill[3])
+            polygon.set_stroke(rgb_to_color(stroke[:3]), stroke_width, stroke[3])
+            polygons.add(polygon)
+        return polygons
+
+
+class RiemannSum(QuadSet):
+    """
+    All the rectangles of a riemann sum as a single :class:`QuadSet`.
+
+    Parameters
+    ----------
+    corners: An (n, 4, 3) array with the vertices of each rectangle,
+        in the same order one would pass them to :class:`Polygon`.
+    samples: Optional :class:`RiemannSamples` the rectangles were made from,
+        for sums derived from this one to reuse.
+    """
+
+    def __init__(self, corners: np.ndarray, samples: RiemannSamples = None, **kwargs):
+        self.corners = np.asarray(corners, dtype=float)
+        self.samples = samples
+        super().__init__(**kwargs)
+
+    def init_points(self):
+        self.set_corners(self.corners)
+
+    def get_num_rects(self):
+        return self.get_num_quads()
+
+    def scale_rects(self, scale_factor: float, about_edge: np.ndarray = None):
+        """
+        Scales every rectangle about the about_edge of its own bounding box,
+        as rect.scale(scale_factor, about_edge=about_edge) would for each.
+        """
+        corners = self.get_corners()
+        mins, maxs = corners.min(1), corners.max(1)
+        about_edge = np.zeros(3) if about_edge is None else np.asarray(about_edge)
+        about_points = ((mins + maxs) / 2 + about_edge * (maxs - mins) / 2)[
+            :, np.newaxis
+        ]
+        return self.set_corners(about_points + scale_factor * (corners - about_points))
+
+    def match_rects_style(self, rects: Iterable[VMobject]):
+        """
+        Gives every rectangle the colors and stroke width of the corresponding
+        one of rects, a :class:`RiemannSum` or a group of rectangles.
+        """
+        if isinstance(rects, RiemannSum):
+            fill_rgbas, stroke_rgbas = rects.get_quad_rgbas()
+            stroke_width = rects.get_stroke_width()
+        else:
+            fill_rgbas = np.array([rect.data["fill_rgba"][0] for rect in rects])
+            stroke_rgbas = np.array([rect.data["stroke_rgba"][0] for rect in rects])
+            stroke_width = rects[0].get_stroke_width()
+        self.set_quad_rgbas(fill_rgbas, stroke_rgbas)
+        return self.set_stroke(width=stroke_width)
+
+    def get_rects(self):
+        """
+        Returns a :class:`VGroup` of one :class:`Polygon` per rectangle, for
+        when the rectangles need to be animated individually.
+        """
+        rects = self.get_polygons()
+        rects.samples = self.samples
+        return rects
+
+
+class GrowRectsFromEdge(Animation):
+    """
+    Grows every rectangle of a :class:`RiemannSum` from the edge of its own
+    bounding box, as a :class:`GrowFromEdge` per rectangle would.
+    """
+
+    def __init__(self, riemann_sum: RiemannSum, edge: np.ndarray, **kwargs):
+        self.edge = edge
+        self.target_corners = riemann_sum.get_corners()
+        super().__init__(riemann_sum, **kwargs)
+
+    def interpolate_mobject(self, alpha: float):
+        self.mobject.set_corners(self.target_corners)
+        self.mobject.scale_rects(self.rate_func(alpha), about_edge=self.edge)
+
+
+class ArcLengthTable:
+    """
+    Monotone lookup table between the parameter t, the arc length and the
+    proportion of arc length along a curve. Built once from points sampled at
+    increasing t_values; every query is a binary search (np.searchsorted) plus
+    a linear interpolation, and accepts whole arrays of values.
+    """
+
+    def __init__(self, t_values: Sequence[float], points: Sequence[Sequence[float]]):
+        self.t_values = np.asarray(t_values, dtype=float)
+        self.points = np.asarray(points, dtype=float)
+        segment_lengths = np.linalg.norm(np.diff(self.points, axis=0), axis=1)
+        self.lengths = np.concatenate([[0], np.cumsum(segment_lengths)])
+        self.total_length = self.lengths[-1]
+
+    @classmethod
+    def from_t_func(
+        cls,
+        t_func: Callable,
+        t_range: Iterable[float],
+        axes: Iterable[NumberLine] = None,
+    ):
+        """
+        Samples t_func over t_range, mapping the points with c2p if axes are given.
+        """
+        t_min, t_max, step = t_range
+        t_values = np.append(np.arange(t_min, t_max, step), t_max)
+        points = sample_t_func(t_func, t_values)
+        return cls(t_values, points if axes is None else c2p(axes, points))
+
+    def matches(self, curve: "ParametricCurve", n_checks: int = 5):
+        """
+        False once the curve has been moved or reshaped after the table was built,
+        or if it wasn't built from this curve. The anchors of the curve are the
+        sampled points, so n_checks of them, ends included, are compared.
+        """
+        anchors = np.vstack([curve.get_start_anchors(), [curve.get_end()]])
+        if len(anchors) != len(self.points):
+            return False
+        indices = np.linspace(0, len(anchors) - 1, n_checks).astype(int)
+        return np.allclose(self.points[indices], anchors[indices])
+
+    def _locate(self, values, table):
+        values = np.clip(np.asarray(values, dtype=float), table[0], table[-1])
+        index = np.searchsorted(table, values, side="right") - 1
+        index = np.clip(index, 0, len(table) - 2)
+        span = table[index + 1] - table[index]
+        alpha = np.divide(
+            values - table[index], span, out=np.zeros_like(values), where=span > 0
+        )
+        return index, alpha
+
+    def _interpolate(self, values, from_table, to_table):
+        index, alpha = self._locate(values, from_table)
+        if to_table.ndim > 1:
+            alpha = alpha[..., np.newaxis]
+        return to_table[index] + alpha * (to_table[index + 1] - to_table[index])
+
+    def length_from_t(self, t):
+        return self._interpolate(t, self.t_values, self.lengths)
+
+    def t_from_length(self, length):
+        return self._interpolate(length, self.lengths, self.t_values)
+
+    def proportion_from_t(self, t):
+        return self.length_from_t(t) / self.total_length
+
+    def t_from_proportion(self, alpha):
+        return self.t_from_length(np.asarray(alpha) * self.total_length)
+
+    def point_from_t(self, t):
+        return self._interpolate(t, self.t_values, self.points)
+
+    def point_from_length(self, length):
+        return self._interpolate(length, self.lengths, self.points)
+
+    def point_from_proportion(self, alpha):
+        return self.point_from_length(np.asarray(alpha) * self.total_length)
 
 
 def get_parametric_curve(
@@ -33,15 +440,33 @@ def get_parametric_curve(
     t_range: Iterable[float],
     **kwargs
 ):
-    return ParametricCurve(lambda t: c2p(axes, t_func(t)), t_range, **kwargs)
+    """
+    The returned curve carries an :class:`ArcLengthTable` as ``arc_length_table``.
+    """
+    curve = ParametricCurve(lambda t: c2p(axes, t_func(t)), t_range, **kwargs)
+    curve.arc_length_table = ArcLengthTable.from_t_func(t_func, t_range, axes)
+    return curve
+
+
+def get_arc_length_table(curve: "ParametricCurve"):
+    """
+    Returns the curve's :class:`ArcLengthTable` if it has one that is still valid.
+    """
+    table = getattr(curve, "arc_length_table", None)
+    if table is None or not table.matches(curve):
+        return None
+    return table
 
 
 def get_flattened_curve(curve: "ParametricCurve", left_edge: Sequence[float]):
     """
     Streches a curve to its arc length and returns a new :class:`Line` with that length.
     """
+    table = get_arc_length_table(curve)
     flat_curve = Line().match_style(curve)
-    flat_curve.set_length(curve.get_arc_length())
+    flat_curve.set_length(
+        curve.get_arc_length() if table is None else table.total_length
+    )
     flat_curve.next_to(left_edge, buff=0)
     return flat_curve
 
@@ -50,19 +475,37 @@ def get_flattened_area(
     riemann_sum: Iterable[Polygon],
     dl_edge: np.ndarray,
 ):
-    flat_area = VGroup()
+    """
+    Lays the rects of riemann_sum side by side on the xz plane, left to right
+    from dl_edge, each keeping its width and height. All the strips are found
+    at once from the (n, 4, 3) array of corners and placed by a cumulative sum
+    of their widths. Returns a :class:`RiemannSum`, or a group of rects if
+    riemann_sum is one.
+    """
+    if isinstance(riemann_sum, RiemannSum):
+        corners = riemann_sum.get_corners()
+    else:
+        corners = np.array([rect.get_vertices()[:4] for rect in riemann_sum])
+    dl_edge = np.asarray(dl_edge, dtype=float)
+    # corners are ur, ul, dl, dr
+    widths = np.linalg.norm(corners[:, 1] - corners[:, 0], axis=1)
+    heights = np.linalg.norm(corners[:, 2] - corners[:, 1], axis=1)
 
-    for rect in riemann_sum:
-        width, height = map(np.linalg.norm, np.diff(rect.get_vertices(), axis=0)[:2])
-        flat_rect = Rectangle(width=width, height=height)
-        flat_rect.match_style(rect)
-        flat_rect.rotate(PI / 2, axis=RIGHT)
-        flat_area.add(flat_rect)
+    lefts = dl_edge[0] + np.concatenate([[0], np.cumsum(widths)[:-1]])
+    dl = np.column_stack(
+        [lefts, np.full(len(lefts), dl_edge[1]), np.full(len(lefts), dl_edge[2])]
+    )
+    dr = dl + np.outer(widths, RIGHT)
+    ul = dl + np.outer(heights, OUT)
+    ur = dr + np.outer(heights, OUT)
 
-    flat_area.arrange(buff=0, aligned_edge=IN).next_to(
-        dl_edge, aligned_edge=IN + LEFT, buff=0
+    flat_area = RiemannSum(
+        np.stack([ur, ul, dl, dr], axis=1), getattr(riemann_sum, "samples", None)
     )
-    return flat_area
+    flat_area.match_rects_style(riemann_sum)
+    if isinstance(riemann_sum, RiemannSum):
+        return flat_area
+    return flat_area.get_rects()
 
 
 def get_y_line_to_point(x_axis: NumberLine, point: Sequence[float], **kwargs):
@@ -75,17 +518,217 @@ def get_x_line_to_point(y_axis: NumberLine, point: Sequence[float], **kwargs):
     return Line(point_on_axis, point, **kwargs)
 
 
+class ScalarFieldSurface(ParametricSurface):
+    """
+    Graph of scalar_field over the u and v ranges, in the coordinate system of
+    axes. The field and c2p are evaluated once on the whole uv grid, instead of
+    once per point as for a uv_func.
+    """
+
+    def __init__(
+        self,
+        scalar_field: Callable[[float, float], float],
+        axes: Iterable[NumberLine],
+        **kwargs
+    ):
+        self.scalar_field = get_vectorized_scalar_field(scalar_field)
+        self.axes = axes
+        super().__init__(
+            lambda u, v: c2p(axes, (u, v, self.scalar_field(u, v))), **kwargs
+        )
+
+    def init_points(self):
+        nu, nv = self.resolution
+        u_values = np.linspace(*self.u_range, nu)
+        v_values = np.linspace(*self.v_range, nv)
+        # points, then those nudged by du and by dv, as in Surface.init_points
+        point_lists = []
+        for du, dv in [(0, 0), (self.epsilon, 0), (0, self.epsilon)]:
+            u, v = np.meshgrid(u_values + du, v_values + dv, indexing="ij")
+            u, v = u.ravel(), v.ravel()
+            coords = np.column_stack([u, v, self.scalar_field(u, v)])
+            point_lists.append(c2p(self.axes, coords))
+        self.set_points(np.vstack(point_lists))
+
+
+def get_lagged_alphas(
+    alpha: float, n_parts: int, lag_ratio: float, rate_func: Callable = None
+):
+    """
+    Alphas of n_parts animated one after the other, each starting lag_ratio of
+    its run time after the previous one, as in a LaggedStart at overall alpha.
+    rate_func is applied to all of them at once if it takes arrays, else to
+    one at a time.
+    """
+    full_length = (n_parts - 1) * lag_ratio + 1
+    alphas = np.clip(alpha * full_length - lag_ratio * np.arange(n_parts), 0, 1)
+    if rate_func is None:
+        return alphas
+    try:
+        return np.broadcast_to(np.asarray(rate_func(alphas), dtype=float), alphas.shape)
+    except (TypeError, ValueError):  # rate_func that only takes numbers
+        return np.array([rate_func(a) for a in alphas])
+
+
+class SphereCloud(Surface):
+    """
+    Copies of one sphere as a single :class:`Surface`. The mesh of the sphere
+    is shared, and only the centers of the copies, and the (x, y) inputs they
+    stand for, are per copy arrays. The centers and the shape of the sphere are
+    mapped along with the points, so they stay right as the cloud is shifted,
+    rotated or scaled, and carried over by interpolate and become, so they also
+    do through save_state, Restore and Transforms between clouds.
+
+    Parameters
+    ----------
+    centers: An (n, 3) array of the centers of the spheres.
+    inputs: An optional (n, 2) array of the inputs the spheres stand for.
+    creation_lag_ratio: How much later each sphere starts growing than the
+        previous one in ShowCreation.
+    """
+
+    def __init__(
+        self,
+        centers: np.ndarray,
+        inputs: np.ndarray = None,
+        creation_lag_ratio: float = 0.2,
+        **sphere_kwargs
+    ):
+        sphere = Sphere(**sphere_kwargs)
+        # (3, k, 3) points and du, dv nudged points of the sphere at the origin
+        self.sphere_points = (
+            np.array(sphere.get_surface_points_and_nudged_points())
+            - sphere.get_center()
+        )
+        self.sphere_triangle_indices = sphere.get_triangle_indices()
+        self.centers = np.asarray(centers, dtype=float)
+        self.inputs = None if inputs is None else np.asarray(inputs, dtype=float)
+        self.creation_lag_ratio = creation_lag_ratio
+        super().__init__(**sphere_kwargs)
+
+    def init_points(self):
+        self.set_centers(self.centers)
+
+    def compute_triangle_indices(self):
+        n_sphere_points = self.sphere_points.shape[1]
+        offsets = n_sphere_points * np.arange(len(self.centers))[:, np.newaxis]
+        self.triangle_indices = (self.sphere_triangle_indices + offsets).ravel()
+
+    def get_triangle_indices(self):
+        if not hasattr(self, "triangle_indices"):
+            self.compute_triangle_indices()
+        return self.triangle_indices
+
+    def get_num_spheres(self):
+        return len(self.centers)
+
+    def get_centers(self):
+        return self.centers.copy()
+
+    def set_centers(self, centers: np.ndarray, scales: np.ndarray = None):
+        """
+        Moves the spheres to centers, optionally scaling each one by scales.
+        """
+        self.centers = np.asarray(centers, dtype=float)
+        sphere_points = self.sphere_points[:, np.newaxis]
+        if scales is not None:
+            sphere_points = sphere_points * np.reshape(scales, (1, -1, 1, 1))
+        points = sphere_points + self.centers[np.newaxis, :, np.newaxis]
+        self.set_points(points.reshape(-1, 3))
+        return self
+
+    def apply_points_function(
+        self, func, about_point=None, about_edge=ORIGIN, **kwargs
+    ):
+        if about_point is None and about_edge is not None:
+            about_point = self.get_bounding_box_point(about_edge)
+        origin = np.zeros(3) if about_point is None else np.asarray(about_point)
+        # copies, as func may change its argument in place
+        self.centers = func(self.centers - origin) + origin
+        self.sphere_points = (
+            func(self.sphere_points.reshape(-1, 3).copy()) - func(np.zeros((1, 3)))
+        ).reshape(self.sphere_points.shape)
+        return super().apply_points_function(func, about_point, about_edge, **kwargs)
+
+    def interpolate(self, cloud1, cloud2, alpha, path_func=straight_path):
+        super().interpolate(cloud1, cloud2, alpha, path_func)
+        if (
+            isinstance(cloud1, SphereCloud)
+            and isinstance(cloud2, SphereCloud)
+            and cloud1.centers.shape == cloud2.centers.shape == self.centers.shape
+        ):
+            self.centers = path_func(cloud1.centers, cloud2.centers, alpha)
+            self.sphere_points = interpolate(
+                cloud1.sphere_points, cloud2.sphere_points, alpha
+            )
+        return self
+
+    def become(self, mobject):
+        super().become(mobject)
+        if isinstance(mobject, SphereCloud):
+            self.centers = mobject.get_centers()
+            self.sphere_points = mobject.sphere_points.copy()
+            self.inputs = mobject.inputs
+            self.compute_triangle_indices()
+        return self
+
+    def pointwise_become_partial(self, cloud, a, b, axis=None):
+        # spheres grow out of their centers one after the other
+        scales = get_lagged_alphas(b, len(cloud.centers), self.creation_lag_ratio)
+        return self.set_centers(cloud.get_centers(), scales)
+
+
+class GrowSpheres(Animation):
+    """
+    Grows the spheres of a :class:`SphereCloud` out of their centers, one after
+    the other staggered by lag_ratio, like a LaggedStartMap of GrowFromCenter.
+    """
+
+    def __init__(self, cloud: SphereCloud, lag_ratio: float = 0.05, **kwargs):
+        super().__init__(cloud, lag_ratio=lag_ratio, **kwargs)
+
+    def begin(self):
+        self.centers = self.mobject.get_centers()
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        scales = get_lagged_alphas(
+            alpha, len(self.centers), self.lag_ratio, self.rate_func
+        )
+        self.mobject.set_centers(self.centers, scales)
+
+
+class MoveSpheres(Animation):
+    """
+    Moves the spheres of a :class:`SphereCloud` to target_centers, one after
+    the other staggered by lag_ratio, like a LaggedStart of move_to's would.
+    """
+
+    def __init__(self, cloud: SphereCloud, target_centers: np.ndarray, **kwargs):
+        self.target_centers = np.asarray(target_centers, dtype=float)
+        super().__init__(cloud, **kwargs)
+
+    def begin(self):
+        self.start_centers = self.mobject.get_centers()
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        alphas = get_lagged_alphas(
+            alpha, len(self.start_centers), self.lag_ratio, self.rate_func
+        )
+        centers = interpolate(
+            self.start_centers, self.target_centers, alphas[:, np.newaxis]
+        )
+        self.mobject.set_centers(centers)
+
+
 def get_sample_input_spheres(
     x_range: Iterable[float],
     y_range: Iterable[float],
     axes: Iterable[NumberLine],
     **sphere_kwargs
 ):
-    spheres = SGroup()
-    for x in np.arange(*x_range):
-        for y in np.arange(*y_range):
-            sphere = Sphere(**sphere_kwargs).move_to(c2p(axes, (x, y, 0)))
-            sphere.x = x
-            sphere.y = y
-            spheres.add(sphere)
-    return spheres
+    x, y = np.meshgrid(np.arange(*x_range), np.arange(*y_range), indexing="ij")
+    inputs = np.column_stack([x.ravel(), y.ravel()])
+    centers = c2p(axes, np.column_stack([inputs, np.zeros(len(inputs))]))
+    return SphereCloud(centers, inputs, **sphere_kwargs)
@@ -20,6 +20,8 @@ class ScalarLineIntegralScene(ThreeDScene):
         "curve_t_func": None,
         "curve_kwargs": {"color": GOLD_E},
         "scalar_field": None,
+        # whether scalar_field works on arrays, None to find out on first use
+        "scalar_field_vectorized": None,
         "t_min": -3,
         "t_max": 3,
         "t_axis_kwargs": {},
@@ -30,6 +32,10 @@ class ScalarLineIntegralScene(ThreeDScene):
     }
 
     def setup(self):
+        if self.scalar_field is not None:
+            self.scalar_field = get_vectorized_scalar_field(
+                self.scalar_field, self.scalar_field_vectorized
+            )
         self.setup_axes()
         self.curve = get_parametric_curve(
             self.axes,
@@ -60,46 +66,81 @@ class ScalarLineIntegralScene(ThreeDScene):
         style = dict(self.area_style, **style)
         return self.get_riemann_sum(n_rects, **style)
 
+    def sample_curve_and_field(self, t_values):
+        curve_points = sample_t_func(self.curve_t_func, t_values)
+        heights = evaluate_scalar_field(
+            self.scalar_field, curve_points[:, 0], curve_points[:, 1]
+        )
+        return np.column_stack([curve_points, heights])
+
+    def get_riemann_samples(self, n_rects):
+        """
+        (n_rects + 1, 4) array with r(t) and f(r(t)) at the edges of the rects.
+        Samples of earlier calls are reused when n_rects is a multiple of
+        a previous n_rects.
+        """
+        if not hasattr(self, "riemann_sampler"):
+            self.riemann_sampler = NestedSampler(
+                self.sample_curve_and_field, self.t_min, self.t_max
+            )
+        return self.riemann_sampler(n_rects)
+
+    def get_riemann_corners(self, n_rects):
+        samples = self.get_riemann_samples(n_rects)
+        curve_points = self.c2p(samples[:, :3])
+        dl, dr = curve_points[:-1], curve_points[1:]
+        ul = self.c2p(np.column_stack([samples[:-1, :2], samples[:-1, 3]]))
+        ur = ul + (dr - dl)
+        return np.stack([ur, ul, dl, dr], axis=1)
+
+    def get_riemann_sum_samples(self, n_rects):
+        samples = self.get_riemann_samples(n_rects)
+        t_values = np.linspace(self.t_min, self.t_max, n_rects + 1)
+        return RiemannSamples(t_values, samples[:, :3], samples[:-1, 3])
+
     def get_riemann_sum(self, n_rects, gradient=None, **style):
         gradient = gradient or self.riemann_gradient
         style = dict(self.area_style, **style)
-        rects = VGroup()
-        t_range, dt = np.linspace(self.t_min, self.t_max, n_rects, False, True)
-
-        for t in t_range:
-            dl = self.c2p(self.curve_t_func(t))
-            dr = self.c2p(self.curve_t_func(t + dt))
-            ul = self.c2p([*dl[:2], self.scalar_field(*dl[:2])])
-            ur = ul + (dr - dl)
-            rects.add(Polygon(ur, ul, dl, dr))
-
+        rects = RiemannSum(
+            self.get_riemann_corners(n_rects), self.get_riemann_sum_samples(n_rects)
+        )
         rects.set_color_by_gradient(*gradient)
         return rects.set_style(**style)
 
+    def get_riemann_rects(self, n_rects, gradient=None, **style):
+        """
+        Same as get_riemann_sum, but with each rect as a separate :class:`Polygon`
+        """
+        return self.get_riemann_sum(n_rects, gradient, **style).get_rects()
+
     def get_rescaled_riemann_sum(self, riemann_sum):
-        # scalar_field = scalar_field or self.scalar_field
-        rescaled_rects = VGroup()
-        t_unit = self.t_axis.get_unit_size()
-        z_unit = self.z_axis.get_unit_size()
-        t_range, dt = np.linspace(self.t_min, self.t_max, len(riemann_sum), False, True)
-
-        for rect, t in zip(riemann_sum, t_range):
-            height = self.scalar_field(*self.curve_t_func(t)[:2])
-            width = get_norm(self.curve_t_func(t + dt) - self.curve_t_func(t))
-            rescaled_rects.add(
-                Rectangle(dt * t_unit, (height * width / dt) * z_unit).set_style(
-                    **rect.get_style()
-                )
+        """
+        Rects of the same areas as those of riemann_sum, over the t axis,
+        found from the samples riemann_sum was made from. Returns a
+        :class:`RiemannSum` or a group of rects, the same as riemann_sum.
+        """
+        samples = getattr(riemann_sum, "samples", None)
+        if samples is None:
+            n_rects = (
+                riemann_sum.get_num_rects()
+                if isinstance(riemann_sum, RiemannSum)
+                else len(riemann_sum)
             )
-
-        rescaled_rects.arrange(buff=0, aligned_edge=DOWN)
-        rescaled_rects.next_to(
-            self.t_axis.n2p(self.t_min),
-            UP,
-            0,
-            aligned_edge=LEFT,
-        )
-        return rescaled_rects
+            samples = self.get_riemann_sum_samples(n_rects)
+
+        widths = samples.dt * self.t_axis.get_unit_size()
+        heights = samples.get_rescaled_heights() * self.z_axis.get_unit_size()
+        lefts = np.concatenate([[0], np.cumsum(widths)[:-1]])
+        dl = self.t_axis.n2p(self.t_min) + np.outer(lefts, RIGHT)
+        dr = dl + np.outer(widths, RIGHT)
+        ul = dl + np.outer(heights, UP)
+        ur = dr + np.outer(heights, UP)
+
+        rescaled_sum = RiemannSum(np.stack([ur, ul, dl, dr], axis=1), samples)
+        rescaled_sum.match_rects_style(riemann_sum)
+        if isinstance(riemann_sum, RiemannSum):
+            return rescaled_sum
+        return rescaled_sum.get_rects()
 
     def c2p(self, coords):
         return c2p(self.axes, coords)
@@ -115,17 +156,43 @@ class ScalarLineIntegralScene(ThreeDScene):
         t_samples=None,
         **transform_kwargs
     ):
+        """
+        Adds step rects every iteration. The rects are transformed as one
+        :class:`RiemannSum` into a target sum allocated once, and t samples come
+        from a pool, so an iteration only evaluates the samples and sets the
+        arrays of the rects.
+        A group of rects is swapped back in at the end, and rects is returned.
+        """
         # style is absolutely unnecessary here, but manim decides not to work without it
         # Transform(rects, self.get_riemann_sum(n_rects, **rect.get_style())) should have
         # worked just as fine. Also, brace and t_sample updaters shouldn't live here;
         # just couldn't figure out a better way
-        for _ in range(n_iters):
-            n_rects = len(rects) + step
-            anims = [
-                Transform(
-                    rects, self.get_riemann_sum(n_rects, **style), **transform_kwargs
-                )
-            ]
+        group = None
+        if not isinstance(rects, RiemannSum):
+            group = rects
+            rects = RiemannSum(np.array([rect.get_vertices()[:4] for rect in group]))
+            rects.match_rects_style(group)
+            self.remove(group)
+            self.add(rects)
+
+        n_rects_list = rects.get_num_rects() + step * np.arange(n_iters + 1)
+        target_rects = RiemannSum(self.get_riemann_corners(n_rects_list[0]))
+        if t_samples is not None:
+            sample_pool = [t_samples[0].copy() for _ in range(n_rects_list[-1] + 1)]
+
+        for n_rects in n_rects_list[1:]:
+            target_rects.set_corners(self.get_riemann_corners(n_rects))
+            target_rects.set_color_by_gradient(*self.riemann_gradient)
+            target_rects.set_style(**dict(self.area_style, **style))
+            # like a group of rects would be, the rects are repeated so that
+            # every target rect has one to come from
+            repeat_indices = np.arange(n_rects) * rects.get_num_rects() // n_rects
+            fill_rgbas, stroke_rgbas = rects.get_quad_rgbas()
+            rects.set_corners(rects.get_corners()[repeat_indices])
+            rects.set_quad_rgbas(
+                fill_rgbas[repeat_indices], stroke_rgbas[repeat_indices]
+            )
+            anims = [Transform(rects, target_rects, **transform_kwargs)]
             if dt_brace is not None:
                 anims.append(
                     ApplyMethod(
@@ -137,9 +204,12 @@ class ScalarLineIntegralScene(ThreeDScene):
                 )
             if t_samples is not None:
                 self.t_samples_kwargs["radius"] *= 0.9
-                upd_samples = self.get_samples_on_t_axis(
-                    n_rects + 1, **self.t_samples_kwargs
-                )
+                upd_samples = SGroup(*sample_pool[: n_rects + 1])
+                for sphere, t in zip(
+                    upd_samples, np.linspace(self.t_min, self.t_max, n_rects + 1)
+                ):
+                    sphere.set_width(2 * self.t_samples_kwargs["radius"])
+                    sphere.move_to(self.t_axis.n2p(t))
                 anims.append(
                     Transform(
                         t_samples,
@@ -150,9 +220,18 @@ class ScalarLineIntegralScene(ThreeDScene):
             self.play(*anims)
             self.wait(wait_time)
 
+        if group is not None:
+            group.set_submobjects(list(rects.get_rects()))
+            self.remove(rects)
+            self.add(group)
+            rects = group
+        return rects
+
     def raise_riemann_rectangles(
         self, rectangles, added_anims=None, **rect_anim_kwargs
     ):
+        # a RiemannSum has no submobjects, so it's raised as a whole
+        rectangles = rectangles.submobjects or [rectangles]
         for rect in rectangles:
             rect.save_state()
             rect.stretch(0.01, 2, about_point=self.plane.c2p(0, 0))
@@ -169,13 +248,10 @@ class ScalarLineIntegralScene(ThreeDScene):
         self, input_spheres, scalar_field=None, added_anims=None, **kwargs
     ):
         scalar_field = scalar_field or self.scalar_field
-        for sphere in input_spheres:
-            # using these x,y attrs is not a good idea; use p2n instead; realized later
-            x, y = sphere.x, sphere.y
-            sphere.target = self.c2p((x, y, scalar_field(x, y)))
-        anims = LaggedStart(
-            *[ApplyMethod(s.move_to, s.target) for s in input_spheres],
-            lag_ratio=kwargs.get("lag_ratio") or 0
+        x, y = input_spheres.inputs.T
+        outputs = np.column_stack([x, y, evaluate_scalar_field(scalar_field, x, y)])
+        anims = MoveSpheres(
+            input_spheres, self.c2p(outputs), lag_ratio=kwargs.get("lag_ratio") or 0
         )
         if added_anims is None:
             added_anims = []
@@ -183,11 +259,7 @@ class ScalarLineIntegralScene(ThreeDScene):
 
     def get_parametric_surface(self, scalar_field=None, **kwargs):
         scalar_field = scalar_field or self.scalar_field
-
-        def uv_func(u, v):
-            return self.c2p((u, v, scalar_field(u, v)))
-
-        return ParametricSurface(uv_func, **kwargs)
+        return ScalarFieldSurface(scalar_field, self.axes, **kwargs)
 
     def get_flattened_area(self, aligned_edge):
         return get_flattened_area(self.area, aligned_edge)
@@ -220,11 +292,22 @@ class ScalarLineIntegralScene(ThreeDScene):
         t_max = t_axis.p2n(t_samples[-1].get_center())
         t_range = t_max - t_min
 
-        anims = []
-        for dot in t_samples:
-            # using pfp here makes it independent of the axes the curve is attached to. Good!
-            target = curve.pfp((t_axis.p2n(dot.get_center()) - t_min) / t_range)
-            anims.append(ApplyMethod(dot.move_to, target))
+        proportions = np.array(
+            [(t_axis.p2n(dot.get_center()) - t_min) / t_range for dot in t_samples]
+        )
+        # using pfp here makes it independent of the axes the curve is attached to. Good!
+        table = get_arc_length_table(curve)
+        if table is None:
+            targets = [curve.pfp(alpha) for alpha in proportions]
+        else:
+            curve_t_min, curve_t_max = table.t_values[[0, -1]]
+            targets = table.point_from_t(
+                curve_t_min + proportions * (curve_t_max - curve_t_min)
+            )
+
+        anims = [
+            ApplyMethod(dot.move_to, target) for dot, target in zip(t_samples, targets)
+        ]
         self.play(*anims, **kwargs)
 
 
@@ -502,7 +585,7 @@ class ScalarFieldAndTheGoal(ScalarLineIntegralScene):
         mesh = SurfaceMesh(surface, color=SCALAR_FIELD_COLOR)
         surface.set_shadow(0.4).set_gloss(0.3)
         self.play(
-            FadeOut(title), ShowCreation(sample_spheres, lag_ratio=0.2), run_time=2
+            FadeOut(title), GrowSpheres(sample_spheres, lag_ratio=0.2), run_time=2
         )
         self.wait()
         self.raise_sample_spheres_to_output(
@@ -724,7 +807,7 @@ class ApproximatingCurvedArea(ScalarLineIntegralScene):
         self.wait()
 
         rs_style = dict(stroke_width=0.05, fill_opacity=0.9, stroke_color=BLACK)
-        riemann_sum = self.get_riemann_sum(6, **rs_style)
+        riemann_sum = self.get_riemann_rects(6, **rs_style)
         self.raise_riemann_rectangles(
             riemann_sum,
             [ApplyMethod(self.area.set_opacity, 0.1)],
@@ -1193,7 +1276,7 @@ class TheYurekaScene(ApproximatingCurvedArea):
         rs_style = dict(stroke_width=0.05, stroke_color=BLACK, fill_opacity=0.75)
         prev_riemann_sum = self.get_riemann_sum(126, **rs_style)
         t_samples = self.get_samples_on_t_axis(
-            len(prev_riemann_sum) + 1, radius=0.015, color=WHITE
+            prev_riemann_sum.get_num_rects() + 1, radius=0.015, color=WHITE
         )
         t_samples.fix_in_frame()
         dt_brace = Brace(t_samples[:2], buff=0.01)
@@ -1215,7 +1298,7 @@ class TheYurekaScene(ApproximatingCurvedArea):
         equivalence.fix_in_frame()
         surr_rect = SurroundingRectangle(equivalence)
         surr_rect.fix_in_frame()
-        riemann_sum = self.get_riemann_sum(6, **rs_style)
+        riemann_sum = self.get_riemann_rects(6, **rs_style)
         rescaled_rs = self.get_rescaled_riemann_sum(riemann_sum)
         rescaled_rs.fix_in_frame()
 
@@ -1383,7 +1466,7 @@ class TheYurekaScene(ApproximatingCurvedArea):
         for _ in range(8):
             n_rects += step
             dt = (self.t_max - self.t_min) * self.t_axis.unit_size / n_rects
-            new_riemann_sum = self.get_riemann_sum(n_rects, **rs_style)
+            new_riemann_sum = self.get_riemann_rects(n_rects, **rs_style)
             new_rescaled_riemann_sum = self.get_rescaled_riemann_sum(new_riemann_sum)
             new_t_samples = self.get_samples_on_t_axis(
                 n_rects + 1, radius=radius, color=WHITE
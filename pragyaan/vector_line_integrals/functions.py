@@ -1,29 +1,397 @@
-from typing import Callable
+from typing import Callable, Iterable, Tuple
 
 import numpy as np
 
 
+def superpose_charge_fields(
+    points: np.ndarray,
+    charge_positions: np.ndarray,
+    charge_magnitudes: np.ndarray,
+    cutoff_distance: float = 0.1,
+):
+    """
+    Sums q * (p - c) / |p - c|^3 over the charges for each of the (N, 3) points,
+    skipping charges closer than cutoff_distance to the point.
+
+    charge_positions, charge_magnitudes are either (M, 3), (M,) arrays shared by
+    all points or (N, M, 3), (N, M) arrays with a set of charges per point.
+    """
+    charge_to_point = points[:, np.newaxis] - charge_positions
+    distances = np.linalg.norm(charge_to_point, axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weights = np.where(
+            distances < cutoff_distance, 0, charge_magnitudes / distances**3
+        )
+    return np.einsum("nm,nmd->nd", weights, charge_to_point)
+
+
+class ChargeTree:
+    """
+    Binary space partition of the charges for Barnes-Hut evaluation. Each node
+    keeps the monopole and dipole moments of its charges about its center, and
+    each leaf keeps its (at most leaf_size) charges, padded with zero charges.
+    """
+
+    def __init__(
+        self, positions: np.ndarray, magnitudes: np.ndarray, leaf_size: int = 16
+    ):
+        self.leaf_size = leaf_size
+        self.centers, self.radii, self.children, self.leaf_indices = [], [], [], []
+        self.monopoles, self.dipoles, self.absolute_charges = [], [], []
+        self.leaf_positions, self.leaf_magnitudes = [], []
+        self.build(positions, magnitudes)
+
+        for name in [
+            "centers",
+            "radii",
+            "children",
+            "leaf_indices",
+            "monopoles",
+            "dipoles",
+            "absolute_charges",
+            "leaf_positions",
+            "leaf_magnitudes",
+        ]:
+            setattr(self, name, np.array(getattr(self, name)))
+
+    def build(self, positions, magnitudes):
+        node = len(self.centers)
+        center = (positions.min(0) + positions.max(0)) / 2
+        self.centers.append(center)
+        self.radii.append(np.linalg.norm(positions - center, axis=1).max())
+        self.monopoles.append(magnitudes.sum())
+        self.dipoles.append(magnitudes @ (positions - center))
+        self.absolute_charges.append(np.abs(magnitudes).sum())
+        self.children.append([-1, -1])
+        self.leaf_indices.append(-1)
+
+        if len(positions) <= self.leaf_size:
+            n_pad = self.leaf_size - len(positions)
+            self.leaf_indices[node] = len(self.leaf_positions)
+            padding = np.tile(center, (n_pad, 1))
+            self.leaf_positions.append(np.vstack([positions, padding]))
+            self.leaf_magnitudes.append(np.append(magnitudes, np.zeros(n_pad)))
+            return node
+
+        axis = np.argmax(positions.max(0) - positions.min(0))
+        order = np.argsort(positions[:, axis], kind="stable")
+        halves = np.array_split(order, 2)
+        self.children[node] = [
+            self.build(positions[half], magnitudes[half]) for half in halves
+        ]
+        return node
+
+    def get_field_and_error_bound(
+        self, points: np.ndarray, theta: float, cutoff_distance: float = 0.1
+    ):
+        """
+        A node is approximated by its monopole and dipole terms when its radius
+        is less than theta times its distance d from the point and none of its
+        charges can be within cutoff_distance. The neglected terms of such a node
+        are bounded by 3 * sum|q| * R^2 / (d^2 * (d - R)^2), and these bounds are
+        summed into the returned error bound of each point.
+        """
+        field = np.zeros_like(points)
+        error_bound = np.zeros(len(points))
+        pair_points = np.arange(len(points))
+        pair_nodes = np.zeros(len(points), dtype=int)
+
+        while len(pair_points):
+            r = points[pair_points] - self.centers[pair_nodes]
+            d = np.linalg.norm(r, axis=1)
+            radius = self.radii[pair_nodes]
+            is_far = (radius < theta * d) & (d - radius >= cutoff_distance)
+
+            # multipole terms
+            far_points, far_nodes = pair_points[is_far], pair_nodes[is_far]
+            r, d, radius = r[is_far], d[is_far, np.newaxis], radius[is_far]
+            dipoles = self.dipoles[far_nodes]
+            dipole_dot_r = np.sum(dipoles * r, axis=1)[:, np.newaxis]
+            np.add.at(
+                field,
+                far_points,
+                self.monopoles[far_nodes, np.newaxis] * r / d**3
+                + 3 * dipole_dot_r * r / d**5
+                - dipoles / d**3,
+            )
+            d = d[:, 0]
+            np.add.at(
+                error_bound,
+                far_points,
+                3
+                * self.absolute_charges[far_nodes]
+                * radius**2
+                / (d**2 * (d - radius) ** 2),
+            )
+
+            # direct sums over the charges of the near leaves
+            is_leaf = ~is_far & (self.children[pair_nodes, 0] < 0)
+            leaf_points = pair_points[is_leaf]
+            leaves = self.leaf_indices[pair_nodes[is_leaf]]
+            np.add.at(
+                field,
+                leaf_points,
+                superpose_charge_fields(
+                    points[leaf_points],
+                    self.leaf_positions[leaves],
+                    self.leaf_magnitudes[leaves],
+                    cutoff_distance,
+                ),
+            )
+
+            # open up the rest of the near nodes
+            is_open = ~is_far & ~is_leaf
+            pair_points = np.repeat(pair_points[is_open], 2)
+            pair_nodes = self.children[pair_nodes[is_open]].ravel()
+
+        return field, error_bound
+
+
+class ChargeField:
+    """
+    Field due to point charges, evaluated at a point or an (N, 3) array of points.
+
+    Parameters
+    ----------
+    charge_position_magnitude_pairs: (position, magnitude) of every charge.
+    theta: 0 sums every charge exactly. A value in (0, 1) uses a Barnes-Hut
+        approximation with opening angle theta, trading accuracy for speed when
+        there are many charges; see get_field_and_error_bound.
+    cutoff_distance: Charges closer than this to a point are ignored.
+    """
+
+    def __init__(
+        self,
+        charge_position_magnitude_pairs: Iterable[Tuple[np.ndarray, float]],
+        theta: float = 0,
+        cutoff_distance: float = 0.1,
+        leaf_size: int = 16,
+        max_pairs_per_chunk: int = 2**20,
+    ):
+        pairs = list(charge_position_magnitude_pairs)
+        self.charge_positions = np.array([p for p, _ in pairs], dtype=float)
+        self.charge_magnitudes = np.array([m for _, m in pairs], dtype=float)
+        self.charge_positions = self.charge_positions.reshape(-1, 3)
+        self.theta = theta
+        self.cutoff_distance = cutoff_distance
+        self.max_pairs_per_chunk = max_pairs_per_chunk
+        self.tree = None
+        if theta > 0 and len(pairs):
+            self.tree = ChargeTree(
+                self.charge_positions, self.charge_magnitudes, leaf_size
+            )
+
+    def __call__(self, point: np.ndarray):
+        points = np.asarray(point, dtype=float)
+        field = self.get_field_and_error_bound(points.reshape(-1, 3))[0]
+        return field.reshape(points.shape)
+
+    def get_field_and_error_bound(self, points: np.ndarray):
+        """
+        Returns the (N, 3) field and an upper bound on the error of each vector.
+        The bound is 0 unless the Barnes-Hut approximation is used.
+        """
+        if self.tree is not None:
+            return self.tree.get_field_and_error_bound(
+                points, self.theta, self.cutoff_distance
+            )
+
+        # chunk the points so that the (N, M, 3) intermediate stays bounded
+        field = np.zeros_like(points)
+        n_charges = max(len(self.charge_magnitudes), 1)
+        chunk_size = max(self.max_pairs_per_chunk // n_charges, 1)
+        for start in range(0, len(points), chunk_size):
+            field[start : start + chunk_size] = superpose_charge_fields(
+                points[start : start + chunk_size],
+                self.charge_positions,
+                self.charge_magnitudes,
+                self.cutoff_distance,
+            )
+        return field, np.zeros(len(points))
+
+
 # model the field as if it were generated by some electric charges.
 # Superpose the field due to individual charges
-def get_magnetic_field_func(charge_position_magnitude_pairs):
-    def field_approx_func(point: np.array):
-        vector = np.zeros(3)
+def get_magnetic_field_func(charge_position_magnitude_pairs, **kwargs):
+    """
+    Returns a :class:`ChargeField`, which works on single points as well as
+    (N, 3) arrays of points. kwargs are passed on to it, e.g. theta to
+    approximate the field of many charges.
+    """
+    return ChargeField(charge_position_magnitude_pairs, **kwargs)
+
+
+# Dormand-Prince 5(4) tableau
+RK45_C = np.array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1, 1])
+RK45_A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+    [35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84],
+]
+RK45_B5 = np.array([35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0])
+RK45_B4 = np.array(
+    [5179 / 57600, 0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40]
+)
+
+
+def evaluate_field(field_func: Callable, points: np.ndarray, vectorized: bool = None):
+    """
+    Calls field_func once on the (N, 3) points if it is vectorized, else once
+    per point. vectorized=None means vectorized only for a :class:`ChargeField`,
+    since whether a field works on arrays can't be told from what it returns.
+    """
+    if vectorized is None:
+        vectorized = isinstance(field_func, ChargeField)
+    if vectorized:
+        return np.asarray(field_func(points), dtype=float).reshape(points.shape)
+    return np.array([field_func(point) for point in points], dtype=float)
+
+
+def estimate_line_integral(curve_points: np.ndarray, field_vectors: np.ndarray):
+    """
+    Line integral of a vector field along a curve, from the (n + 1, 3) points
+    r(t) of the curve at evenly spaced values of t and the field F(r(t)) there,
+    by the trapezoidal rule on the chords, sum (F_i + F_i+1) / 2 . (r_i+1 - r_i).
+
+    The error is estimated by comparing with the same rule on every other point,
+    which has four times its (h^2) error, so it is |fine - coarse| / 3. For odd
+    n the last interval is left out of that comparison, as the coarse rule needs
+    equal steps of 2h.
+
+    Returns
+    -------
+    (estimate, error), with an infinite error when n < 2.
+    """
+    curve_points = np.asarray(curve_points, dtype=float)
+    field_vectors = np.asarray(field_vectors, dtype=float)
+
+    def trapezoid(step, stop):
+        points = curve_points[:stop:step]
+        vectors = field_vectors[:stop:step]
+        mean_field = (vectors[:-1] + vectors[1:]) / 2
+        return np.einsum("nd,nd->", mean_field, np.diff(points, axis=0))
+
+    n = len(curve_points) - 1
+    estimate = trapezoid(1, n + 1)
+    if n < 2:
+        return estimate, np.inf
+    even_stop = n - n % 2 + 1
+    error = abs(trapezoid(1, even_stop) - trapezoid(2, even_stop)) / 3
+    return estimate, error
+
+
+def trace_field_lines(
+    field_func: Callable[[np.ndarray], np.ndarray],
+    seeds: np.ndarray,
+    direction: float = 1,
+    max_length: float = 50,
+    max_steps: int = 2000,
+    initial_step: float = 0.1,
+    min_step: float = 1e-4,
+    max_step: float = 0.5,
+    tolerance: float = 1e-5,
+    closure_distance: float = 0.1,
+    vectorized: bool = None,
+):
+    """
+    Traces the field lines through all the seeds together, integrating the unit
+    field direction over arc length with adaptive Dormand-Prince (RK45) steps.
+
+    A line stops when it comes back within closure_distance of its seed after
+    having left it ("closed"), or at a singularity ("singular"): where the field
+    vanishes, where the line turns back on itself (a sink or a source), or where
+    the step size has to drop below min_step to meet the tolerance. Otherwise it
+    stops when it runs out of max_length or max_steps.
+
+    vectorized is passed on to :func:`evaluate_field`.
+
+    Returns
+    -------
+    A list with the (n_i, 3) array of points along each line, and an array with
+    the reason each line stopped.
+    """
+    seeds = np.array(seeds, dtype=float).reshape(-1, 3)
+    n_lines = len(seeds)
+    paths = np.zeros((n_lines, max_steps + 1, 3))
+    paths[:, 0] = seeds
+    n_points = np.ones(n_lines, dtype=int)
+    lengths = np.zeros(n_lines)
+    steps = np.full(n_lines, float(initial_step))
+    has_left_seed = np.zeros(n_lines, dtype=bool)
+    last_segments = np.zeros((n_lines, 3))
+    stop_reasons = np.full(n_lines, "", dtype=object)
+
+    def unit_direction(points):
+        vectors = evaluate_field(field_func, points, vectorized)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return direction * vectors / norms
+
+    active = np.arange(n_lines)
+    while len(active):
+        points = paths[active, n_points[active] - 1]
+        h = np.minimum(steps[active], max_length - lengths[active])[:, np.newaxis]
+
+        ks = []
+        for a_row in RK45_A:
+            stage = points + h * sum(a * k for a, k in zip(a_row, ks))
+            ks.append(unit_direction(stage))
+        ks = np.array(ks)
+        new_points = points + h * np.einsum("s,snd->nd", RK45_B5, ks)
+        errors = np.linalg.norm(
+            h * np.einsum("s,snd->nd", RK45_B5 - RK45_B4, ks), axis=1
+        )
+
+        is_singular = ~np.isfinite(ks).all(axis=(0, 2))
+        is_accepted = ~is_singular & (errors <= tolerance)
+        with np.errstate(divide="ignore"):
+            factors = 0.9 * (tolerance / errors) ** 0.2
+        factors = np.clip(np.nan_to_num(factors, nan=0.2, posinf=5), 0.2, 5)
+        new_steps = np.minimum(h[:, 0] * factors, max_step)
+        is_singular |= (h[:, 0] < min_step) & (lengths[active] + h[:, 0] < max_length)
+        is_singular |= ~is_accepted & (new_steps < min_step)
+        steps[active] = new_steps
 
-        for charge_position, charge_magnitude in charge_position_magnitude_pairs:
-            charge_to_point = point - charge_position
-            point_distance = np.linalg.norm(charge_to_point)
+        accepted = active[is_accepted]
+        segments = new_points[is_accepted] - points[is_accepted]
+        # the direction flips within the step (the chord is much shorter than
+        # the arc) or between steps
+        is_turning_back = np.linalg.norm(segments, axis=1) < h[is_accepted, 0] / 2
+        is_turning_back |= np.sum(segments * last_segments[accepted], axis=1) < 0
+        is_singular[np.flatnonzero(is_accepted)[is_turning_back]] = True
+        last_segments[accepted] = segments
 
-            if point_distance < 0.1:
-                continue
-            else:
-                charge_to_point /= point_distance ** 3
-                charge_to_point *= charge_magnitude
+        paths[accepted, n_points[accepted]] = new_points[is_accepted]
+        n_points[accepted] += 1
+        lengths[accepted] += h[is_accepted, 0]
 
-            vector += charge_to_point
+        # closest approach of the new segment to the seed
+        starts = points[is_accepted]
+        to_seed = seeds[accepted] - starts
+        with np.errstate(divide="ignore", invalid="ignore"):
+            alphas = np.sum(to_seed * segments, axis=1) / np.sum(segments**2, axis=1)
+        alphas = np.clip(np.nan_to_num(alphas), 0, 1)[:, np.newaxis]
+        seed_distances = np.linalg.norm(to_seed - alphas * segments, axis=1)
+        is_closed = has_left_seed[accepted] & (seed_distances < closure_distance)
+        has_left_seed[accepted] |= (
+            np.linalg.norm(new_points[is_accepted] - seeds[accepted], axis=1)
+            > 2 * closure_distance
+        )
+        paths[accepted[is_closed], n_points[accepted[is_closed]] - 1] = seeds[
+            accepted[is_closed]
+        ]
 
-        return vector
+        stop_reasons[active[is_singular]] = "singular"
+        stop_reasons[accepted[lengths[accepted] >= max_length]] = "max_length"
+        stop_reasons[accepted[n_points[accepted] > max_steps]] = "max_steps"
+        stop_reasons[accepted[is_closed]] = "closed"
+        active = active[stop_reasons[active] == ""]
 
-    return field_approx_func
+    return [path[:n] for path, n in zip(paths, n_points)], stop_reasons
 
 
 def get_compass_path(
@@ -31,16 +399,22 @@ def get_compass_path(
     starting_point: np.array,
     distance_along_vector: float = 0.25,
     distance_threshold: float = 0.1,
+    max_length: float = 100,
+    vectorized: bool = None,
 ):
-    path = [starting_point]
-    point = starting_point
-
-    while 1:
-        vector = field_func(point)
-        norm = np.linalg.norm(vector)
-        point = point + (vector / norm) * distance_along_vector
-        if len(path) > 1 and (abs(path[-1][0] - path[0][0]) < distance_threshold):
-            break
-        else:
-            path.append(point)
-    return path
+    """
+    Points along the field line through starting_point, at most
+    distance_along_vector apart, ending where the line closes on itself
+    (within distance_threshold), hits a singularity or reaches max_length.
+    """
+    paths, _ = trace_field_lines(
+        field_func,
+        [starting_point],
+        max_length=max_length,
+        max_steps=int(np.ceil(max_length / distance_along_vector)) * 4,
+        initial_step=distance_along_vector,
+        max_step=distance_along_vector,
+        closure_distance=distance_threshold,
+        vectorized=vectorized,
+    )
+    return list(paths[0])
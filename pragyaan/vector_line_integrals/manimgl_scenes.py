@@ -2,7 +2,13 @@ from manimlib import *
 
 from utils import ellipse
 
-from ..scalar_line_integrals.functions import get_parametric_curve
+from ..scalar_line_integrals.functions import (
+    GrowRectsFromEdge,
+    GrowSpheres,
+    RiemannSum,
+    get_parametric_curve,
+    sample_t_func,
+)
 from ..scalar_line_integrals.scenes import (
     CURVE_COLOR,
     T_COLOR,
@@ -11,6 +17,7 @@ from ..scalar_line_integrals.scenes import (
     OpeningSceneLineIntegrals,
     ScalarLineIntegralScene,
 )
+from .functions import estimate_line_integral, evaluate_field
 from .manimgl_animations import ConstantAreaAnimation, GrowVectors, ShrinkVectors
 
 CAMERA_CONFIG = dict(samples=32, anti_alias_width=1.50)
@@ -105,8 +112,7 @@ class IntroPrevVideo(OpeningSceneLineIntegrals):
 
         # get_rescaled_riemann_sum is a pathetic method, refactor!
         rescaled_area = self.get_rescaled_riemann_sum(self.area)
-        for rect in rescaled_area:
-            rect.scale(y_axis.get_unit_size(), about_edge=DOWN)
+        rescaled_area.scale_rects(y_axis.get_unit_size(), about_edge=DOWN)
         rescaled_area.rotate(PI / 2, axis=RIGHT, about_point=axes_origin)
         rescaled_area.next_to(
             self.t_axis.n2p(-3), RIGHT, buff=0, aligned_edge=IN + LEFT
@@ -245,7 +251,7 @@ class VectorFieldSummary(OpeningSceneLineIntegrals):
         self.play(
             AnimationGroup(
                 ShrinkVectors(self.field, scale_factor=0.01, save_state=True),
-                LaggedStartMap(GrowFromCenter, self.spheres_at_tails),
+                GrowSpheres(self.spheres_at_tails),
                 lag_ratio=0.5,
                 run_time=2,
             )
@@ -823,64 +829,90 @@ class VectorFieldLineIntegrals(ScalarLineIntegralScene):
     def change_in_t_animation(self, target_t, **kwargs):
         return ApplyMethod(self.t_tracker.set_value, target_t, **kwargs)
 
-    def get_riemann_sum(self, n_rects, gradient=None, **rect_style):
-        if gradient is None:
-            gradient = self.riemann_gradient
-        style = dict(self.area_style, **rect_style)
-
-        rects = VGroup()
-        t_range, dt = np.linspace(
-            self.t_min, self.t_max, n_rects, endpoint=False, retstep=True
+    def get_field_vectors(self, points):
+        """
+        field_func at each of the (N, 3) points, called once with the arrays of
+        coordinates when it works on arrays, else once per point.
+        """
+        try:
+            vectors = np.asarray(self.field_func(*points.T), dtype=float)
+            if vectors.shape == points.T.shape:
+                return vectors.T
+        except (TypeError, ValueError):
+            pass
+        return evaluate_field(lambda point: self.field_func(*point), points, False)
+
+    def sample_curve_and_field(self, t_values):
+        curve_points = sample_t_func(self.t_func, t_values)
+        return np.column_stack([curve_points, self.get_field_vectors(curve_points)])
+
+    def get_riemann_samples(self, n_rects):
+        """
+        (n_rects + 1, 4) array with r(t) at the edges of the rects and the
+        height of each rect, F(r(t)).dr/|dr| at its start (0 for the last row).
+        """
+        samples = super().get_riemann_samples(n_rects)
+        curve_points, field_vectors = samples[:, :3], samples[:-1, 3:]
+        displacements = np.diff(curve_points, axis=0)
+        lengths = np.linalg.norm(displacements, axis=1)
+        # zero height where the curve doesn't move, like normalize would give
+        heights = np.divide(
+            np.einsum("nd,nd->n", field_vectors, displacements),
+            lengths,
+            out=np.zeros(n_rects),
+            where=lengths > 0,
+        )
+        return np.column_stack([curve_points, np.append(heights, 0)])
+
+    def get_line_integral_estimate(self, n_rects):
+        """
+        (estimate, error) of the line integral from the same samples of the
+        curve and the field as the riemann sum of n_rects rects.
+        """
+        samples = super().get_riemann_samples(n_rects)
+        return estimate_line_integral(samples[:, :3], samples[:, 3:])
+
+    def get_line_integral_label(self, n_rects, **kwargs):
+        """
+        The estimate of the line integral from n_rects rects. Its error is only
+        an estimate too, not a bound, so the value is rounded one decimal place
+        coarser than the error would suggest.
+        """
+        estimate, error = self.get_line_integral_estimate(n_rects)
+        n_decimals = 5
+        if error > 0:
+            n_decimals = int(np.clip(-np.floor(np.log10(error)) - 1, 0, 5))
+        return Tex(
+            rf"\int_C \vec{{F}} \cdot d\vec{{r}} \approx {estimate:.{n_decimals}f}",
+            **kwargs,
         )
 
-        for t in t_range:
-            r_t = self.t_func(t)
-            r_t_plus_dt = self.t_func(t + dt)
-
-            force_vect = self.field_func(*r_t)
-            unit_displacement = normalize(r_t_plus_dt - r_t)
-            height = np.dot(force_vect, unit_displacement)
-
-            dl = self.c2p(r_t)
-            dr = self.c2p(r_t_plus_dt)
-            ul = self.c2p([*r_t[:2], height])
-            ur = ul + (dr - dl)
-            rects.add(Polygon(ur, ul, dl, dr, **style))
-
-        rects.set_color_by_gradient(*gradient)
-        return rects
-
     def get_rescaled_riemann_sum(self, riemann_sum, new_axes, **style):
-        x_unit = new_axes.x_axis.get_unit_size()
-        y_unit = new_axes.y_axis.get_unit_size()
-        t_range, dt = np.linspace(
-            self.t_min, self.t_max, len(riemann_sum), endpoint=False, retstep=True
-        )
+        """
+        Rects of the same areas as those of riemann_sum, over the x axis of
+        new_axes, found from the samples riemann_sum was made from. Returns a
+        :class:`RiemannSum` or a group of rects, the same as riemann_sum.
+        """
+        samples = riemann_sum.samples
         style = dict(self.area_style, **style)
-        rescaled_sum = VGroup()
+        widths = samples.dt * new_axes.x_axis.get_unit_size()
+        heights = samples.get_rescaled_heights() * new_axes.y_axis.get_unit_size()
 
-        for rect, t in zip(riemann_sum, t_range):
-            r_t = self.t_func(t)
-            r_t_plus_dt = self.t_func(t + dt)
-
-            height = np.dot(self.field_func(*r_t), normalize(r_t_plus_dt - r_t))
-            width = np.linalg.norm(r_t_plus_dt - r_t)
+        t_min = samples.t_values[0]
+        x_unit_vect = new_axes.x_axis.n2p(t_min + 1) - new_axes.x_axis.n2p(t_min)
+        dl = new_axes.x_axis.n2p(t_min) + np.outer(
+            samples.t_values[:-1] - t_min, x_unit_vect
+        )
+        dr = dl + np.outer(widths, RIGHT)
+        ul = dl + np.outer(heights, UP)
+        ur = dr + np.outer(heights, UP)
 
-            rescaled_rect = Rectangle(
-                width=dt * x_unit,
-                height=((width * height) / dt) * y_unit,
-                color=rect.get_color(),
-                **style,
-            )
-            rescaled_rect.next_to(
-                new_axes.x_axis.n2p(t),
-                direction=UR if height > 0 else DR,
-                buff=0,
-                aligned_edge=LEFT,
-            )
-            rescaled_sum.add(rescaled_rect)
+        rescaled_sum = RiemannSum(np.stack([ur, ul, dl, dr], axis=1), samples)
+        rescaled_sum.match_rects_style(riemann_sum)
         rescaled_sum.set_style(**style)
-        return rescaled_sum
+        if isinstance(riemann_sum, RiemannSum):
+            return rescaled_sum
+        return rescaled_sum.get_rects()
 
     def shrink_riemann_sum(self, riemann_sum, factor=0.01, dim=2, save_state=True):
         about_edge = [LEFT, DOWN, IN][dim]
@@ -1414,10 +1446,7 @@ class TypicalApproach(VectorLineIntegralsScenes):
         self.play(
             AnimationGroup(
                 ShowCreation(axes),
-                LaggedStart(
-                    *[GrowFromEdge(mob, DOWN) for mob in rescaled_riemann_sum],
-                    lag_ratio=0,
-                ),
+                GrowRectsFromEdge(rescaled_riemann_sum, DOWN),
                 lag_ratio=0.25,
                 run_time=1,
             )
@@ -1427,6 +1456,7 @@ class TypicalApproach(VectorLineIntegralsScenes):
             ApplyWave(self.area, amplitude=0.5, direction=OUT),
             ApplyWave(rescaled_riemann_sum, amplitude=0.5),
         )
+
         self.wait(8)
 
 
@@ -1520,7 +1550,7 @@ class ApproximationScene(VectorLineIntegralsScenes):
 
         self.assumptions[2:].set_opacity(0.5)
 
-        self.riemann_sum = self.get_riemann_sum(4, stroke_width=4)
+        self.riemann_sum = self.get_riemann_rects(4, stroke_width=4)
         self.shrink_riemann_sum(self.riemann_sum)
 
         self.t_samples = self.get_samples_on_t_axis(
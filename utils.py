@@ -3,16 +3,33 @@ from typing import Sequence
 import numpy as np
 
 
+def project_onto_lines(points: Sequence[float], lines: Sequence[float]):
+    """
+    Feet of the perpendiculars from points onto the lines, and the distances of
+    points from them. points is a point or an (N, 3) array, lines the endpoints
+    of a line, shape (2, 3), or of M lines, shape (M, 2, 3). Returns arrays of
+    shape (N, 3) and (N,) for a line, (N, M, 3) and (N, M) for M lines,
+    without the N for a single point.
+    """
+    points, lines = np.asarray(points, dtype=float), np.asarray(lines, dtype=float)
+    starts, ends = lines[..., 0, :], lines[..., 1, :]
+    if lines.ndim > 2:
+        points = points[..., np.newaxis, :]
+    unit_vects = ends - starts
+    unit_vects /= np.linalg.norm(unit_vects, axis=-1, keepdims=True)
+    along = np.sum((points - starts) * unit_vects, axis=-1, keepdims=True)
+    feet = starts + along * unit_vects
+    return feet, np.linalg.norm(points - feet, axis=-1)
+
+
 def project_along_line(
     vertex1: Sequence[float], vertex2: Sequence[float], point: Sequence[float]
 ):
     """
     Given 2 vertices defining a line, return
-    the projection of point on that line
+    the projection of point (or an (N, 3) array of points) on that line
     """
-    vertex1, vertex2, point = map(np.array, (vertex1, vertex2, point))
-    unit_vect = np.linalg.norm(vertex2 - vertex1)
-    return vertex1 + unit_vect * np.dot(point - vertex1, unit_vect)
+    return project_onto_lines(point, [vertex1, vertex2])[0]
 
 
 def ellipse(a: float, b: float, theta: float):